@@ -0,0 +1,78 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from rest_framework.serializers import ModelSerializer  # noqa: E402
+
+from tests.misc.test_fast_representation import (  # noqa: E402
+    FastRepresentationNestedModel,
+    FastRepresentationOwnerModel,
+    FastRepresentationParentModel,
+)
+from drf_nested_model_serializer.serializer import NestedModelSerializer  # noqa: E402
+
+ROWS = 10_000
+REPEAT = 5
+
+
+class NestedSerializer(ModelSerializer):
+    class Meta:
+        model = FastRepresentationNestedModel
+        fields = ("id", "name", "amount", "date", "owner")
+
+
+class GenericParentSerializer(ModelSerializer):
+    nested = NestedSerializer(many=True)
+
+    class Meta:
+        model = FastRepresentationParentModel
+        fields = ("id", "name", "nested")
+
+
+class FastParentSerializer(NestedModelSerializer):
+    nested = NestedSerializer(many=True)
+
+    class Meta:
+        model = FastRepresentationParentModel
+        fields = ("id", "name", "nested")
+
+
+def main():
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    owner = FastRepresentationOwnerModel.objects.create(name="Owner")
+    parent = FastRepresentationParentModel.objects.create(name="Parent")
+    FastRepresentationNestedModel.objects.bulk_create(
+        FastRepresentationNestedModel(
+            parent=parent, owner=owner, name=f"Nested {i}", amount=i % 1000
+        )
+        for i in range(ROWS)
+    )
+    parent = FastRepresentationParentModel.objects.prefetch_related("nested").get()
+
+    results = {}
+    for serializer_class in (GenericParentSerializer, FastParentSerializer):
+        assert len(serializer_class(instance=parent).data["nested"]) == ROWS
+        results[serializer_class.__name__] = min(
+            timeit.repeat(
+                lambda: serializer_class(instance=parent).data,
+                number=1,
+                repeat=REPEAT,
+            )
+        )
+
+    for name, seconds in results.items():
+        print(f"{name:<24} {seconds * 1000:8.1f} ms")
+    speedup = results["GenericParentSerializer"] / results["FastParentSerializer"]
+    print(f"{'Speed-up':<24} {speedup:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
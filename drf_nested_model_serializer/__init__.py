@@ -1,3 +1,3 @@
-import serializer
+from . import serializer
 
 __all__ = ["serializer"]
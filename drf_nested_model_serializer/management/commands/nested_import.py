@@ -0,0 +1,124 @@
+import json
+import mmap
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from django.utils.module_loading import import_string
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class Command(BaseCommand):
+    help = "Imports an NDJSON file through a NestedModelSerializer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("serializer", help="Dotted path of the serializer.")
+        parser.add_argument("file", help="NDJSON file with one payload per line.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--rejects",
+            help="File for rejected lines. Defaults to '<file>.rejects'.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            serializer_class = import_string(options["serializer"])
+        except ImportError as exc:
+            raise CommandError(str(exc)) from exc
+        if not (
+            isinstance(serializer_class, type)
+            and issubclass(serializer_class, NestedModelSerializer)
+        ):
+            raise CommandError(
+                f"'{options['serializer']}' is not a NestedModelSerializer."
+            )
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        self.rejects_path = options["rejects"] or f"{options['file']}.rejects"
+        self.rejects_file = None
+        connection = connections[router.db_for_write(serializer_class.Meta.model)]
+
+        created = 0
+        updated = 0
+        rejected = 0
+        start = time.perf_counter()
+        try:
+            with open(options["file"], "rb") as file:
+                lines = iter(self._read_lines(file))
+                chunk_number = 0
+                while True:
+                    chunk = list(islice(lines, options["chunk_size"]))
+                    if not chunk:
+                        break
+                    chunk_number += 1
+
+                    payloads = []
+                    for line_number, line in chunk:
+                        try:
+                            payloads.append((line_number, json.loads(line)))
+                        except ValueError as exc:
+                            self._reject(
+                                line_number, line.decode(errors="replace"), str(exc)
+                            )
+                            rejected += 1
+
+                    queries = []
+                    chunk_start = time.perf_counter()
+                    with connection.execute_wrapper(
+                        lambda execute, *args: queries.append(1) or execute(*args)
+                    ):
+                        summary = serializer_class.bulk_save(
+                            (payload for _, payload in payloads),
+                            chunk_size=len(chunk),
+                            on_error=lambda index, data, errors: self._reject(
+                                payloads[index][0], data, errors
+                            ),
+                        )
+                    elapsed = time.perf_counter() - chunk_start
+
+                    created += summary.created
+                    updated += summary.updated
+                    rejected += summary.failed
+                    self.stdout.write(
+                        f"Chunk {chunk_number}: {len(chunk)} rows, "
+                        f"{len(queries)} queries, "
+                        f"{len(chunk) / max(elapsed, 1e-9):.0f} rows/s"
+                    )
+        finally:
+            if self.rejects_file is not None:
+                self.rejects_file.close()
+
+        elapsed = time.perf_counter() - start
+        rows = created + updated + rejected
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {created + updated} rows ({created} created, "
+                f"{updated} updated) in {elapsed:.2f}s, "
+                f"{rows / max(elapsed, 1e-9):.0f} rows/s."
+            )
+        )
+        if rejected:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Rejected {rejected} rows, written to '{self.rejects_path}'."
+                )
+            )
+
+    def _read_lines(self, file):
+        if not file.seek(0, 2):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line_number, line in enumerate(iter(mapped.readline, b""), 1):
+                line = line.strip()
+                if line:
+                    yield line_number, line
+
+    def _reject(self, line_number, data, errors):
+        if self.rejects_file is None:
+            self.rejects_file = open(self.rejects_path, "w")
+        self.rejects_file.write(
+            json.dumps({"line": line_number, "data": data, "errors": errors}) + "\n"
+        )
@@ -1,95 +1,545 @@
-from functools import cached_property
-from typing import Sequence
-from rest_framework.fields import empty
+import pickle
+from collections import namedtuple
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import md5
+from itertools import islice
+from uuid import uuid4
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import cached_property, partial, reduce
+from operator import attrgetter, or_
+from typing import Mapping, Sequence
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import Field, SkipField, empty, get_error_detail
+from rest_framework.relations import PKOnlyObject
+from rest_framework.renderers import JSONRenderer
 from rest_framework.serializers import (
+    LIST_SERIALIZER_KWARGS,
+    LIST_SERIALIZER_KWARGS_REMOVE,
     ModelSerializer,
     ListSerializer,
     PrimaryKeyRelatedField,
+    Serializer,
+    raise_errors_on_nested_writes,
 )
 from rest_framework.utils import model_meta
-from django.db import models
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+from django.db import connections, models, router, transaction
 
 INCLUDE_FIELD = "nested_include"
 EXCLUDE_FIELD = "nested_exclude"
+BATCH_LOOKUP_FIELD = "nested_batch_lookup"
+BULK_FIELD = "nested_bulk"
+REFRESH_FIELD = "nested_refresh"
+ATOMIC_FIELD = "nested_atomic"
+SAVEPOINTS_FIELD = "nested_savepoints"
+CACHE_FIELD = "nested_cache"
+CACHE_TIMEOUT_FIELD = "nested_cache_timeout"
+UPSERT_KEYS_FIELD = "nested_upsert_keys"
+LOOKUP_FIELDS_FIELD = "nested_lookup_fields"
+VALIDATION_WORKERS_FIELD = "nested_validation_workers"
 ALL_FIELDS = "__all__"
 
+REFRESH_NONE = "none"
+REFRESH_TOP_LEVEL = "top-level-only"
+REFRESH_FULL = "full"
+
+SAVEPOINTS_NONE = "none"
+SAVEPOINTS_LEVEL = "level"
+SAVEPOINTS_ENTRY = "entry"
+
+ON_ERROR_RAISE = "raise"
+ON_ERROR_SKIP = "skip"
+
+BulkSaveSummary = namedtuple(
+    "BulkSaveSummary", ("created", "updated", "failed", "errors")
+)
+
+_CACHE_KEY_PREFIX = "drf_nested_model_serializer"
+_representation_cache_aliases = set()
+
+
+class NestedPrimaryKeyRelatedField(PrimaryKeyRelatedField):
+    def batch_lookup(self, values):
+        model = self.queryset.model
+        pks = {
+            pk
+            for pk in (_to_primary_key(model, value) for value in values)
+            if pk is not None
+        }
+        _get_identity_map(self).fetch(model, pks)
+
+    def to_internal_value(self, data):
+        model = self.queryset.model
+        identity_map = _get_identity_map(self)
+        if self.pk_field is None:
+            pk = _to_primary_key(model, data)
+            if pk is not None and identity_map.contains(model, pk):
+                instance = identity_map.get(model, pk)
+                if instance is None:
+                    self.fail("does_not_exist", pk_value=data)
+                return instance
+        return identity_map.add(super().to_internal_value(data))
+
+
+class _IdentityMap:
+    def __init__(self):
+        self._instances = {}
+        self._lookups = {}
+
+    def contains(self, model, pk):
+        return _identity_key(model, pk) in self._instances
+
+    def get(self, model, pk):
+        return self._instances.get(_identity_key(model, pk))
+
+    def add(self, instance):
+        if instance is None or instance.pk is None:
+            return instance
+        key = _identity_key(type(instance), instance.pk)
+        if self._instances.get(key) is None:
+            self._instances[key] = instance
+        return self._instances[key]
+
+    def fetch(self, model, pks):
+        missing = [pk for pk in pks if not self.contains(model, pk)]
+        if missing:
+            instances = model._default_manager.in_bulk(missing)
+            for pk in missing:
+                self._instances[_identity_key(model, pk)] = instances.get(pk)
+        return {pk: self.get(model, pk) for pk in pks}
+
+    def lookup(self, model, fields, keys):
+        lookups = self._lookups.setdefault(_identity_key(model, fields), {})
+        missing = [key for key in keys if key not in lookups]
+        if missing:
+            if len(fields) == 1:
+                condition = models.Q(**{f"{fields[0]}__in": [k[0] for k in missing]})
+            else:
+                condition = reduce(
+                    or_, (models.Q(**dict(zip(fields, key))) for key in missing)
+                )
+            for key in missing:
+                lookups[key] = None
+            model_fields = [model._meta.get_field(name) for name in fields]
+            for instance in model._default_manager.filter(condition):
+                key = tuple(getattr(instance, field.attname) for field in model_fields)
+                if key in lookups:
+                    lookups[key] = self.add(instance)
+        return {key: lookups[key] for key in keys}
+
 
 class NestedModelSerializer(ModelSerializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._add_primary_key_fields()
         self._make_related_field_read_only()
+        self._remove_unique_validators()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        alias = getattr(getattr(cls, "Meta", None), CACHE_FIELD, None)
+        if alias is not None:
+            _representation_cache_aliases.add(alias)
+
+        declared_fields = cls._declared_fields
+        for name, field in declared_fields.items():
+            if type(field) is ListSerializer and isinstance(
+                field.child, ModelSerializer
+            ):
+                kwargs = {**field._kwargs, "child": deepcopy(field.child)}
+                declared_fields[name] = NestedListSerializer(*field._args, **kwargs)
+
+    def run_validation(self, data=empty):
+        if self._get_nested_root() is self:
+            self._batch_lookup_primary_keys([data])
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, Mapping):
+            return super().to_internal_value(data)
+
+        nested = {
+            field.field_name: name
+            for name, field in self._nested_serializers.items()
+            if not isinstance(field, ListSerializer)
+        }
+        ret = {}
+        errors = {}
+        for field in self._writable_fields:
+            validate_method = getattr(self, "validate_" + field.field_name, None)
+            primitive_value = field.get_value(data)
+            try:
+                if field.field_name in nested:
+                    validated_value = self._validate_nested_entry(
+                        nested[field.field_name], field, primitive_value
+                    )
+                else:
+                    validated_value = field.run_validation(primitive_value)
+                if validate_method is not None:
+                    validated_value = validate_method(validated_value)
+            except ValidationError as exc:
+                errors[field.field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field.field_name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                self.set_value(ret, field.source_attrs, validated_value)
+
+        if errors:
+            raise ValidationError(errors)
+        return ret
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {}
+        for key in LIST_SERIALIZER_KWARGS_REMOVE:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+        list_kwargs["child"] = cls(*args, **kwargs)
+        list_kwargs.update(
+            {
+                key: value
+                for key, value in kwargs.items()
+                if key in LIST_SERIALIZER_KWARGS
+            }
+        )
+        meta = getattr(cls, "Meta", None)
+        list_serializer_class = getattr(
+            meta, "list_serializer_class", NestedListSerializer
+        )
+        return list_serializer_class(*args, **list_kwargs)
+
+    async def ais_valid(self, *, raise_exception=False):
+        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        return await sync_to_async(self.save)(**kwargs)
+
+    @property
+    def data(self):
+        try:
+            with _written_caches(self.__dict__.get("_nested_written")):
+                return super().data
+        finally:
+            self.__dict__.pop("_nested_written", None)
+
+    def to_representation(self, instance):
+        if not isinstance(instance, models.Model):
+            return super().to_representation(instance)
+        alias = getattr(self.Meta, CACHE_FIELD, None)
+        reader = _get_representation_reader(self)
+        if (
+            alias is None
+            or instance.pk is None
+            or "_nested_written" in self._get_nested_root().__dict__
+        ):
+            return _read_representation(reader, instance)
+
+        cache = caches[alias]
+        key = self._get_representation_cache_key(alias, instance)
+        representation = cache.get(key)
+        if representation is None:
+            representation = _read_representation(reader, instance)
+            timeout = getattr(self.Meta, CACHE_TIMEOUT_FIELD, DEFAULT_TIMEOUT)
+            cache.set(key, representation, timeout)
+        return representation
 
     def create(self, validated_data):
-        disabled_serializers = self._handle_forward_nested(validated_data)
-        reverse_data = self._pop_reverse_data(validated_data)
-        instance = super().create(validated_data)
-        self._reactivate_serializers(disabled_serializers)
-        self._handle_reverse_nested(instance, reverse_data)
-        instance.refresh_from_db()
+        self._pop_refresh_option(validated_data)
+        with self._atomic():
+            instance = self._save_batch([(None, validated_data)], bulk=False)[0]
+            self._invalidate_representation_caches()
         return instance
 
     def update(self, instance, validated_data):
-        disabled_serializers = self._handle_forward_nested(validated_data)
-        reverse_data = self._pop_reverse_data(validated_data)
-        instance = super().update(instance, validated_data)
-        self._reactivate_serializers(disabled_serializers)
-        self._handle_reverse_nested(instance, reverse_data)
-        instance.refresh_from_db()
+        self._pop_refresh_option(validated_data)
+        with self._atomic():
+            instance = self._save_batch([(instance, validated_data)], bulk=False)[0]
+            self._invalidate_representation_caches()
         return instance
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        eager_loading = cls.__dict__.get("_compiled_eager_loading")
+        if eager_loading is None:
+            eager_loading = _compile_eager_loading(cls())
+            cls._compiled_eager_loading = eager_loading
+        return _apply_eager_loading(queryset, eager_loading)
+
+    @classmethod
+    def stream(cls, queryset, chunk_size=1000, **kwargs):
+        renderer = JSONRenderer()
+        queryset = cls.setup_eager_loading(queryset.order_by("pk"))
+        separator = b""
+        last_pk = None
+        yield b"["
+        while True:
+            chunk = queryset
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+            chunk = list(chunk[:chunk_size])
+            if not chunk:
+                break
+            data = cls(chunk, many=True, **kwargs).data
+            yield separator + b",".join(renderer.render(entry) for entry in data)
+            separator = b","
+            last_pk = chunk[-1].pk
+            if len(chunk) < chunk_size:
+                break
+        yield b"]"
+
+    @classmethod
+    def bulk_save(
+        cls, iterable, chunk_size=1000, on_error=ON_ERROR_RAISE, context=None
+    ):
+        assert on_error in (ON_ERROR_RAISE, ON_ERROR_SKIP) or callable(on_error), (
+            f"The 'on_error' argument must be '{ON_ERROR_RAISE}', '{ON_ERROR_SKIP}' or a callable. Got '{on_error}'."
+        )
+
+        created = 0
+        updated = 0
+        failed = 0
+        errors = []
+        iterator = iter(iterable)
+        offset = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            serializer = NestedListSerializer(
+                child=cls(context=context or {}), context=context or {}
+            )
+            entries, chunk_errors = serializer._validate_entries(chunk)
+            if chunk_errors and on_error == ON_ERROR_RAISE:
+                raise ValidationError(
+                    {offset + index: detail for index, detail in chunk_errors}
+                )
+            for index, detail in chunk_errors:
+                failed += 1
+                if on_error == ON_ERROR_SKIP:
+                    errors.append((offset + index, detail))
+                else:
+                    on_error(offset + index, chunk[index], detail)
+
+            updated += sum(instance is not None for instance, _ in entries)
+            created += sum(instance is None for instance, _ in entries)
+            if entries:
+                serializer._save_entries(entries)
+            offset += len(chunk)
+
+        return BulkSaveSummary(created, updated, failed, errors)
+
     def _add_primary_key_fields(self):
-        for field in self._nested_serializers.values():
-            nested_pk_name = _get_pk_name(field)
+        for name, field in self._nested_serializers.items():
+            nested_pk_name = self._nesting_plan[name].pk_name
             if isinstance(field, ListSerializer):
                 field = field.child
-            field.fields[nested_pk_name] = PrimaryKeyRelatedField(
-                queryset=field.Meta.model.objects.all(), required=False, allow_null=True
+            field.fields[nested_pk_name] = NestedPrimaryKeyRelatedField(
+                queryset=field.Meta.model._default_manager.all(),
+                required=False,
+                allow_null=True,
             )
-            self._override_run_validation(field)
 
     def _make_related_field_read_only(self):
         for name, serializer in self._nested_serializers_reverse.items():
             if isinstance(serializer, ListSerializer):
                 serializer = serializer.child
-            model_field: models.Field = self.Meta.model._meta.get_field(name)
-            related_name = model_field.field.name
+            related_name = self._nesting_plan[name].related_name
             if related_name in serializer.fields:
                 serializer.fields[related_name].write_only = False
                 serializer.fields[related_name].read_only = True
 
-    def _override_run_validation(self, field):
-        original = field.run_validation
-        pk_name = _get_pk_name(field)
-
-        def run_validation(data=empty):
-            original_required = {}
-            if isinstance(data, dict) and data.get(pk_name, None) is not None:
-                field.partial = True
-                for name, nested_field in field.fields.items():
-                    original_required[name] = nested_field.required
-                    nested_field.required = False
-            result = original(data)
-            for name, required in original_required.items():
-                field.fields[name].required = required
-            return result
-
-        field.run_validation = run_validation
-
-    def _handle_forward_nested(self, validated_data):
-        result = self._update_or_create_nested(
-            validated_data, self._nested_serializers_forward
+    def _remove_unique_validators(self):
+        for name, serializer in self._nested_serializers.items():
+            relation = self._nesting_plan[name]
+            keys = relation.upsert_keys + relation.lookup_fields
+            if not keys:
+                continue
+            if isinstance(serializer, ListSerializer):
+                serializer = serializer.child
+            for key in keys:
+                if key in serializer.fields:
+                    field = serializer.fields[key]
+                    field.validators = [
+                        validator
+                        for validator in field.validators
+                        if not isinstance(validator, UniqueValidator)
+                    ]
+            serializer.validators = [
+                validator
+                for validator in serializer.validators
+                if not (
+                    isinstance(validator, UniqueTogetherValidator)
+                    and set(validator.fields) <= set(keys)
+                )
+            ]
+
+    def _validate_nested_entry(self, name, serializer, data):
+        relation = self._nesting_plan.get(name)
+        if relation is None or not isinstance(data, Mapping):
+            return serializer.run_validation(data)
+        instance = None
+        if data.get(relation.pk_name) is None:
+            instance = self._lookup_nested_instance(relation, data)
+            if instance is None:
+                return serializer.run_validation(data)
+
+        # Entries with a primary key are validated partially
+        root = self.root
+        partial = root.partial
+        root.partial = True
+        try:
+            ret = serializer.run_validation(data)
+        finally:
+            root.partial = partial
+
+        if instance is not None:
+            ret[relation.pk_name] = instance
+        return ret
+
+    def _lookup_nested_instance(self, relation, data):
+        if not relation.lookup_fields:
+            return None
+        model = relation.serializer_class.Meta.model
+        key = _get_lookup_key(model, relation.lookup_fields, data)
+        if key is None:
+            return None
+        identity_map = _get_identity_map(self)
+        return identity_map.lookup(model, relation.lookup_fields, [key])[key]
+
+    def _batch_lookup_primary_keys(self, entries):
+        enabled = getattr(self.Meta, BATCH_LOOKUP_FIELD, True)
+        for name, field in self._nested_serializers.items():
+            serializer = field
+            if isinstance(field, ListSerializer):
+                serializer = field.child
+
+            nested_entries = []
+            for entry in entries:
+                if not isinstance(entry, Mapping):
+                    continue
+                value = entry.get(field.field_name)
+                if not isinstance(field, ListSerializer):
+                    value = [value]
+                if isinstance(value, list):
+                    nested_entries += [v for v in value if isinstance(v, Mapping)]
+
+            relation = self._nesting_plan[name]
+            if enabled:
+                serializer.fields[relation.pk_name].batch_lookup(
+                    entry.get(relation.pk_name) for entry in nested_entries
+                )
+            if enabled and relation.lookup_fields:
+                model = serializer.Meta.model
+                keys = {
+                    _get_lookup_key(model, relation.lookup_fields, entry)
+                    for entry in nested_entries
+                    if entry.get(relation.pk_name) is None
+                }
+                keys.discard(None)
+                _get_identity_map(self).lookup(model, relation.lookup_fields, keys)
+            if isinstance(serializer, NestedModelSerializer):
+                serializer._batch_lookup_primary_keys(nested_entries)
+
+    def _get_nested_root(self):
+        nested_root = self
+        parent = self.parent
+        while parent is not None:
+            if isinstance(parent, NestedModelSerializer):
+                nested_root = parent
+            parent = parent.parent
+        return nested_root
+
+    def _atomic(self):
+        nested_root = self._get_nested_root()
+        if nested_root is not self or not getattr(self.Meta, ATOMIC_FIELD, True):
+            return nullcontext()
+        return transaction.atomic(using=router.db_for_write(self.Meta.model))
+
+    def _savepoint(self, savepoints):
+        if self._get_nested_root()._get_savepoints() != savepoints:
+            return nullcontext()
+        return transaction.atomic(using=router.db_for_write(self.Meta.model))
+
+    def _get_savepoints(self):
+        savepoints = getattr(self.Meta, SAVEPOINTS_FIELD, SAVEPOINTS_NONE)
+        assert savepoints in (SAVEPOINTS_NONE, SAVEPOINTS_LEVEL, SAVEPOINTS_ENTRY), (
+            f"The '{SAVEPOINTS_FIELD}' option must be '{SAVEPOINTS_NONE}', '{SAVEPOINTS_LEVEL}' or '{SAVEPOINTS_ENTRY}'. Got '{savepoints}'."
         )
-        for name, value in result.items():
-            validated_data[name] = value
+        return savepoints
 
-        disabled_serializers = []
-        for name, serializer in self._nested_serializers_forward.items():
-            if isinstance(validated_data.get(name), (list, dict)):
-                serializer.read_only = True
-                disabled_serializers.append(serializer)
+    def _get_representation_cache_key(self, alias, instance):
+        versions = _get_cache_versions(self.root, alias, self._cache_dependencies)
+        token = md5(":".join(versions).encode()).hexdigest()
+        serializer_class = type(self)
+        return f"{_CACHE_KEY_PREFIX}:{serializer_class.__module__}.{serializer_class.__qualname__}:{instance.pk}:{token}"
 
-        return disabled_serializers
+    def _invalidate_representation_caches(self):
+        if self._get_nested_root() is not self or not _representation_cache_aliases:
+            return
+        self.root.__dict__.pop("_nested_cache_versions", None)
+        transaction.on_commit(
+            partial(_bump_cache_versions, self._written_cache_dependencies),
+            using=router.db_for_write(self.Meta.model),
+        )
+
+    @cached_property
+    def _cache_dependencies(self):
+        labels = set()
+        _collect_cache_dependencies(self, labels)
+        return tuple(sorted(labels))
+
+    @cached_property
+    def _written_cache_dependencies(self):
+        labels = {self.Meta.model._meta.label_lower}
+        for serializer in self._nested_serializers.values():
+            if isinstance(serializer, ListSerializer):
+                serializer = serializer.child
+            if isinstance(serializer, NestedModelSerializer):
+                labels.update(serializer._written_cache_dependencies)
+            else:
+                labels.add(serializer.Meta.model._meta.label_lower)
+        return tuple(sorted(labels))
+
+    def _pop_refresh_option(self, validated_data):
+        if REFRESH_FIELD in validated_data:
+            self._nested_refresh = validated_data.pop(REFRESH_FIELD)
+
+    def _refresh(self, instances):
+        nested_root = self._get_nested_root()
+        refresh = getattr(nested_root, "_nested_refresh", None)
+        if refresh is None:
+            refresh = getattr(nested_root.Meta, REFRESH_FIELD, REFRESH_TOP_LEVEL)
+
+        assert refresh in (REFRESH_NONE, REFRESH_TOP_LEVEL, REFRESH_FULL) or (
+            isinstance(refresh, Sequence) and not isinstance(refresh, str)
+        ), (
+            f"The '{REFRESH_FIELD}' option must be '{REFRESH_NONE}', '{REFRESH_TOP_LEVEL}', '{REFRESH_FULL}' or a sequence of field names. Got '{refresh}'."
+        )
+
+        if refresh == REFRESH_NONE or not instances:
+            return
+        elif refresh == REFRESH_FULL:
+            for instance in instances:
+                instance.refresh_from_db()
+        elif nested_root is not self:
+            return
+        elif len(instances) > 1:
+            fields = None if refresh == REFRESH_TOP_LEVEL else refresh
+            _refresh_instances(instances, fields)
+        elif refresh == REFRESH_TOP_LEVEL:
+            instances[0].refresh_from_db()
+        else:
+            instances[0].refresh_from_db(fields=refresh)
 
     def _pop_reverse_data(self, validated_data):
         return {
@@ -102,115 +552,528 @@ class NestedModelSerializer(ModelSerializer):
         for serializer in disabled_serializers:
             serializer.read_only = False
 
-    def _handle_reverse_nested(self, instance, reverse_data):
-        for name, value in reverse_data.items():
-            if value is None:
-                continue
-            model_field = self.Meta.model._meta.get_field(name)
-            if isinstance(model_field, (models.OneToOneRel, models.ManyToOneRel)):
-                if not isinstance(value, list):
-                    value[model_field.field.name] = instance
-                else:
-                    for entry in value:
-                        entry[model_field.field.name] = instance
-        for name, value in reverse_data.items():
-            nested_serializer = self._nested_serializers_reverse[name]
-
-            model_field = self.Meta.model._meta.get_field(nested_serializer.source)
-
-            if isinstance(model_field, models.OneToOneRel):
-                previous_instance = getattr(instance, nested_serializer.source, None)
-                pk_name = _get_pk_name(nested_serializer)
-                next_instance = getattr(value, pk_name, None)
-                if previous_instance is not None and previous_instance != next_instance:
-                    if model_field.field.null:
-                        setattr(previous_instance, model_field.field.name, None)
-                        previous_instance.save()
-                    else:
-                        previous_instance.delete()
-            elif isinstance(model_field, models.ManyToOneRel):
-                previous_instances = getattr(instance, nested_serializer.source).all()
-                pk_name = _get_pk_name(nested_serializer)
-                next_instances = [
-                    entry[pk_name]
-                    for entry in value
-                    if entry.get(pk_name, None) is not None
-                ]
-
-                for entry in previous_instances:
-                    if entry not in next_instances:
-                        if model_field.field.null:
-                            setattr(entry, model_field.field.name, None)
-                        else:
-                            entry.delete()
-            elif isinstance(model_field, models.ManyToManyRel):
-                previous_instances = getattr(instance, nested_serializer.source).all()
-                pk_name = _get_pk_name(nested_serializer)
-                next_instances = [
-                    entry[pk_name]
-                    for entry in value
-                    if entry.get(pk_name, None) is not None
-                ]
-
-                for entry in previous_instances:
-                    if entry not in next_instances:
-                        entry.delete()
-
-        result = self._update_or_create_nested(
-            reverse_data, self._nested_serializers_reverse
-        )
+    def _record_written(self, instance, result):
+        nested_root = self._get_nested_root()
+        written = nested_root.__dict__.setdefault("_nested_written", [])
         for name, value in result.items():
-            nested_serializer = self._nested_serializers_reverse[name]
-            model_field = self.Meta.model._meta.get_field(nested_serializer.source)
+            relation = self._nesting_plan[name]
+            if isinstance(value, list):
+                value = list({id(entry): entry for entry in value}.values())
+            written.append((instance, relation.source, relation.model_field, value))
+
+    def _save_batch(self, entries, bulk=True):
+        forward_results, disabled_serializers = self._write_forward_batch(
+            [data for _, data in entries]
+        )
+        reverse_data = [self._pop_reverse_data(data) for _, data in entries]
+        created = [instance is None for instance, _ in entries]
+        instances = self._save_instances(entries, bulk)
+        self._reactivate_serializers(disabled_serializers)
+        reverse_results = self._write_reverse_batch(instances, reverse_data, created)
+        self._refresh(instances)
+        for instance, forward_result, reverse_result in zip(
+            instances, forward_results, reverse_results
+        ):
+            self._record_written(instance, {**forward_result, **reverse_result})
+        return instances
+
+    def _write_forward_batch(self, items):
+        results = [{} for _ in items]
+        for name in self._nested_serializers_forward:
+            self._write_relation_batch(name, items, results)
+        for data, result in zip(items, results):
+            data.update(result)
+
+        disabled_serializers = []
+        for name, serializer in self._nested_serializers_forward.items():
+            if any(isinstance(data.get(name), (list, dict)) for data in items):
+                serializer.read_only = True
+                disabled_serializers.append(serializer)
 
-            if model_field.multiple:
-                getattr(instance, nested_serializer.source).set(value)
+        return results, disabled_serializers
 
-    def _update_or_create_nested(self, validated_data, relations):
-        result = {}
-        for name, value in validated_data.items():
-            if name not in relations or value is None:
+    def _write_reverse_batch(self, instances, reverse_data, created):
+        results = [{} for _ in instances]
+        for name in self._nested_serializers_reverse:
+            relation = self._nesting_plan[name]
+            items = [
+                (index, data[name])
+                for index, data in enumerate(reverse_data)
+                if name in data
+            ]
+            if not items:
                 continue
+            one_to_one = isinstance(relation.model_field, models.OneToOneRel)
+
+            if isinstance(
+                relation.model_field, (models.OneToOneRel, models.ManyToOneRel)
+            ):
+                for index, value in items:
+                    for entry in [value] if isinstance(value, Mapping) else value or []:
+                        entry[relation.related_name] = instances[index]
+
+            previous_pks = set()
+            parents = [
+                instances[index]
+                for index, value in items
+                if not created[index] and (value is not None or one_to_one)
+            ]
+            if parents:
+                model = relation.model_field.related_model
+                previous_pks = set(
+                    model._default_manager.filter(
+                        **{f"{relation.related_name}__in": parents}
+                    ).values_list("pk", flat=True)
+                )
+            if one_to_one:
+                for _, value in items:
+                    next_instance = (
+                        None if value is None else value.get(relation.pk_name)
+                    )
+                    if next_instance is not None:
+                        previous_pks.discard(next_instance.pk)
+                self._remove_reverse_nested(relation, previous_pks)
+                previous_pks = set()
+
+            self._write_relation_batch(name, reverse_data, results)
 
-            if not isinstance(value, Sequence):
-                result[name] = self._update_or_create_nested_entry(name, value)
+            written_pks = set()
+            for index, value in items:
+                if value is None and one_to_one:
+                    results[index][name] = None
+                elif isinstance(value, list):
+                    written_pks.update(entry.pk for entry in results[index][name])
+            self._remove_reverse_nested(relation, previous_pks - written_pks)
+
+            if isinstance(relation.model_field, models.ManyToManyRel):
+                self._set_many_to_many(
+                    relation.model_field,
+                    [
+                        (instances[index], results[index][name])
+                        for index, value in items
+                        if value is not None
+                    ],
+                )
+        return results
+
+    def _write_relation_batch(self, name, items, results):
+        positions = []
+        values = []
+        for index, data in enumerate(items):
+            value = data.get(name)
+            if value is None:
+                continue
+            if isinstance(value, Mapping):
+                positions.append((index, len(values), None))
+                values.append(value)
             else:
-                result[name] = [
-                    self._update_or_create_nested_entry(name, entry) for entry in value
-                ]
+                positions.append((index, len(values), len(value)))
+                values.extend(value)
+        if not positions:
+            return
+
+        with self._savepoint(SAVEPOINTS_LEVEL):
+            instances = self._update_or_create_nested_list(name, values)
+        for index, start, length in positions:
+            if length is None:
+                results[index][name] = instances[start]
+            else:
+                results[index][name] = instances[start : start + length]
+
+    def _save_instances(self, entries, bulk=True):
+        model = self.Meta.model
+        many_to_many = self._pop_many_to_many(model, [data for _, data in entries])
+        instances = [None] * len(entries)
+        bulk_create = []
+        bulk_update = []
+        for index, (instance, data) in enumerate(entries):
+            can_bulk_save = bulk and self._can_bulk_save(data)
+            if can_bulk_save and instance is None and _can_bulk_insert(model):
+                bulk_create.append(index)
+            elif can_bulk_save and instance is not None:
+                bulk_update.append(index)
+            elif instance is None:
+                instances[index] = ModelSerializer.create(self, data)
+            elif self._get_nested_root() is self:
+                instances[index] = ModelSerializer.update(self, instance, data)
+            else:
+                instances[index] = _update_changed_fields(self, instance, data)
+
+        created = self._bulk_create(model, [entries[i][1] for i in bulk_create])
+        for index, instance in zip(bulk_create, created):
+            instances[index] = instance
+        updated = self._bulk_update(model, [entries[i] for i in bulk_update])
+        for index, instance in zip(bulk_update, updated):
+            instances[index] = instance
+
+        identity_map = _get_identity_map(self)
+        instances = [identity_map.add(instance) for instance in instances]
+        for model_field, items in many_to_many:
+            self._set_many_to_many(
+                model_field, [(instances[index], value) for index, value in items]
+            )
+        return instances
+
+    def _can_bulk_save(self, data):
+        if not getattr(self.Meta, BULK_FIELD, True):
+            return False
+        return all(
+            _get_concrete_field(self.Meta.model, field_name) is not None
+            for field_name in data
+        )
+
+    def _remove_reverse_nested(self, relation, pks):
+        if not pks:
+            return
+        model = relation.model_field.related_model
+        queryset = model._default_manager.filter(pk__in=pks)
+        if relation.null and not isinstance(relation.model_field, models.ManyToManyRel):
+            queryset.update(**{relation.related_name: None})
+        else:
+            queryset.delete()
+
+    def _update_or_create_nested_list(self, name, values):
+        relation = self._nesting_plan[name]
+        synced = [
+            index
+            for index, value in enumerate(values)
+            if self._can_sync_many_to_many(name, value)
+        ]
+        many_to_many = self._pop_many_to_many(
+            relation.serializer_class.Meta.model, [values[i] for i in synced]
+        )
+        result = [None] * len(values)
+        bulk_create = []
+        bulk_update = []
+        batch = []
+        bulk_upsert = []
+        for index, value in enumerate(values):
+            if self._can_bulk_upsert(name, value):
+                bulk_upsert.append(index)
+            elif self._can_bulk_create(name, value):
+                bulk_create.append(index)
+            elif self._can_bulk_update(name, value):
+                bulk_update.append(index)
+            elif self._can_batch(name):
+                batch.append(index)
+            else:
+                result[index] = self._update_or_create_nested_entry(name, value)
+
+        instances = self._batch_nested(name, [values[i] for i in batch])
+        for index, instance in zip(batch, instances):
+            result[index] = instance
+        instances = self._bulk_upsert_nested(name, [values[i] for i in bulk_upsert])
+        for index, instance in zip(bulk_upsert, instances):
+            result[index] = instance
+
+        instances = self._bulk_update_nested(name, [values[i] for i in bulk_update])
+        for index, instance in zip(bulk_update, instances):
+            result[index] = instance
+        instances = self._bulk_create_nested(name, [values[i] for i in bulk_create])
+        for index, instance in zip(bulk_create, instances):
+            result[index] = instance
+
+        for model_field, items in many_to_many:
+            self._set_many_to_many(
+                model_field, [(result[synced[index]], value) for index, value in items]
+            )
         return result
 
+    def _can_sync_many_to_many(self, name, value):
+        relation = self._nesting_plan[name]
+        if relation.upsert_keys or not relation.to_many.intersection(value):
+            return False
+        if value.get(relation.pk_name) is None:
+            return relation.serializer_class.create is ModelSerializer.create
+        return relation.serializer_class.update is ModelSerializer.update
+
+    def _pop_many_to_many(self, model, items):
+        if not getattr(self.Meta, BULK_FIELD, True):
+            return []
+        many_to_many = {}
+        for index, data in enumerate(items):
+            for field_name in list(data):
+                if field_name not in many_to_many:
+                    model_field = _get_relation_field(model, field_name)
+                    if not isinstance(
+                        model_field, (models.ManyToManyField, models.ManyToManyRel)
+                    ):
+                        model_field = None
+                    many_to_many[field_name] = (model_field, [])
+                model_field, entries = many_to_many[field_name]
+                if model_field is not None:
+                    entries.append((index, data.pop(field_name)))
+        return [
+            (model_field, entries)
+            for model_field, entries in many_to_many.values()
+            if model_field is not None
+        ]
+
+    def _set_many_to_many(self, model_field, entries):
+        if not entries:
+            return
+        if isinstance(model_field, models.ManyToManyRel):
+            field = model_field.field
+            accessor_name = model_field.get_accessor_name()
+            source_name = field.m2m_reverse_field_name()
+            target_name = field.m2m_field_name()
+        else:
+            field = model_field
+            accessor_name = field.name
+            source_name = field.m2m_field_name()
+            target_name = field.m2m_reverse_field_name()
+        through = field.remote_field.through
+        if (
+            not getattr(self.Meta, BULK_FIELD, True)
+            or not through._meta.auto_created
+            or field.remote_field.symmetrical
+        ):
+            for instance, targets in entries:
+                getattr(instance, accessor_name).set(targets)
+            return
+
+        source = through._meta.get_field(source_name).attname
+        target = through._meta.get_field(target_name).attname
+        expected = {}
+        for instance, targets in entries:
+            expected[instance.pk] = {
+                value.pk if isinstance(value, models.Model) else value
+                for value in targets
+            }
+        current = {pk: set() for pk in expected}
+        for source_pk, target_pk in through._default_manager.filter(
+            **{f"{source}__in": list(expected)}
+        ).values_list(source, target):
+            current[source_pk].add(target_pk)
+
+        added = [
+            through(**{source: source_pk, target: target_pk})
+            for source_pk, target_pks in expected.items()
+            for target_pk in target_pks - current[source_pk]
+        ]
+        removed = [
+            models.Q(**{source: source_pk, f"{target}__in": target_pks})
+            for source_pk, target_pks in (
+                (source_pk, current[source_pk] - expected[source_pk])
+                for source_pk in expected
+            )
+            if target_pks
+        ]
+        with self._savepoint(SAVEPOINTS_ENTRY):
+            if added:
+                through._default_manager.bulk_create(added, ignore_conflicts=True)
+            if removed:
+                through._default_manager.filter(reduce(or_, removed)).delete()
+
+        cache_name = _get_prefetch_cache_name(model_field)
+        for instance, _ in entries:
+            getattr(instance, "_prefetched_objects_cache", {}).pop(cache_name, None)
+
+    def _can_batch(self, name):
+        serializer_class = self._nesting_plan[name].serializer_class
+        if not issubclass(serializer_class, NestedModelSerializer):
+            return False
+        if serializer_class.create is not NestedModelSerializer.create:
+            return False
+        if serializer_class.update is not NestedModelSerializer.update:
+            return False
+        return self._get_nested_root()._get_savepoints() != SAVEPOINTS_ENTRY
+
+    def _batch_nested(self, name, values):
+        if not values:
+            return []
+        serializer = self._nested_serializers[name]
+        if isinstance(serializer, ListSerializer):
+            serializer = serializer.child
+        pk_name = self._nesting_plan[name].pk_name
+        instances = serializer._save_batch(
+            [(value.pop(pk_name, None), value) for value in values]
+        )
+        identity_map = _get_identity_map(self)
+        return [identity_map.add(instance) for instance in instances]
+
+    def _can_bulk(self, name, value):
+        if not getattr(self.Meta, BULK_FIELD, True):
+            return False
+        relation = self._nesting_plan[name]
+        return not any(field_name in relation.to_many for field_name in value)
+
+    def _can_bulk_create(self, name, value):
+        relation = self._nesting_plan[name]
+        if value.get(relation.pk_name) is not None:
+            return False
+        if relation.serializer_class.create is not ModelSerializer.create:
+            return False
+        if not self._can_bulk(name, value):
+            return False
+        return _can_bulk_insert(relation.serializer_class.Meta.model)
+
+    def _can_bulk_upsert(self, name, value):
+        relation = self._nesting_plan[name]
+        if not relation.upsert_keys or value.get(relation.pk_name) is not None:
+            return False
+        if not all(key in value for key in relation.upsert_keys):
+            return False
+        if relation.serializer_class.create is not ModelSerializer.create:
+            return False
+        if not self._can_bulk(name, value):
+            return False
+        model = relation.serializer_class.Meta.model
+        if not all(
+            _get_concrete_field(model, field_name) is not None
+            for field_name in value
+            if field_name != relation.pk_name
+        ):
+            return False
+        connection = connections[router.db_for_write(model)]
+        return (
+            _can_bulk_insert(model)
+            and connection.features.supports_update_conflicts_with_target
+        )
+
+    def _bulk_upsert_nested(self, name, values):
+        relation = self._nesting_plan[name]
+        model = relation.serializer_class.Meta.model
+        unique_fields = list(relation.upsert_keys)
+        groups = {}
+        for index, value in enumerate(values):
+            value.pop(relation.pk_name, None)
+            update_fields = tuple(key for key in value if key not in unique_fields)
+            key = tuple(value[field_name] for field_name in unique_fields)
+            groups.setdefault(update_fields or tuple(unique_fields), {}).setdefault(
+                key, []
+            ).append(index)
+
+        result = [None] * len(values)
+        identity_map = _get_identity_map(self)
+        for update_fields, entries in groups.items():
+            indexes = list(entries.values())
+            with self._savepoint(SAVEPOINTS_ENTRY):
+                instances = model._default_manager.bulk_create(
+                    [model(**values[group[-1]]) for group in indexes],
+                    update_conflicts=True,
+                    unique_fields=unique_fields,
+                    update_fields=update_fields,
+                )
+            for group, instance in zip(indexes, instances):
+                for index in group:
+                    result[index] = identity_map.add(instance)
+        return result
+
+    def _can_bulk_update(self, name, value):
+        relation = self._nesting_plan[name]
+        if value.get(relation.pk_name) is None:
+            return False
+        if relation.serializer_class.update is not ModelSerializer.update:
+            return False
+        if not self._can_bulk(name, value):
+            return False
+        model = relation.serializer_class.Meta.model
+        return all(
+            _get_concrete_field(model, field_name) is not None
+            for field_name in value
+            if field_name != relation.pk_name
+        )
+
+    def _bulk_create_nested(self, name, values):
+        if not values:
+            return []
+        model = self._nesting_plan[name].serializer_class.Meta.model
+        for value in values:
+            value.pop(self._nesting_plan[name].pk_name, None)
+        return self._bulk_create(model, values)
+
+    def _bulk_create(self, model, values):
+        if not values:
+            return []
+        with self._savepoint(SAVEPOINTS_ENTRY):
+            instances = model._default_manager.bulk_create(
+                [model(**value) for value in values]
+            )
+        identity_map = _get_identity_map(self)
+        return [identity_map.add(instance) for instance in instances]
+
+    def _bulk_update_nested(self, name, values):
+        if not values:
+            return []
+        model = self._nesting_plan[name].serializer_class.Meta.model
+        pk_name = self._nesting_plan[name].pk_name
+        return self._bulk_update(
+            model, [(value.pop(pk_name), value) for value in values]
+        )
+
+    def _bulk_update(self, model, entries):
+        if not entries:
+            return []
+        instances = []
+        changed_instances = {}
+        for instance, value in entries:
+            changed = _assign_changed_fields(instance, value)
+            if changed:
+                changed_instances.setdefault(tuple(changed), []).append(instance)
+            instances.append(instance)
+
+        for changed, group in changed_instances.items():
+            with self._savepoint(SAVEPOINTS_ENTRY):
+                model._default_manager.bulk_update(group, changed)
+        identity_map = _get_identity_map(self)
+        return [identity_map.add(instance) for instance in instances]
+
     def _update_or_create_nested_entry(self, name, value):
         serializer = self._nested_serializers[name]
         if isinstance(serializer, ListSerializer):
             serializer = serializer.child
-        pk_name = _get_pk_name(serializer)
-        instance = value.pop(pk_name, None)
-        if instance is None:
-            return serializer.create(value)
-        else:
-            return serializer.update(instance, value)
+        instance = value.pop(self._nesting_plan[name].pk_name, None)
+        with self._savepoint(SAVEPOINTS_ENTRY):
+            if instance is None:
+                instance = serializer.create(value)
+            elif type(serializer).update is ModelSerializer.update:
+                instance = _update_changed_fields(serializer, instance, value)
+            else:
+                instance = serializer.update(instance, value)
+        return _get_identity_map(self).add(instance)
 
     @cached_property
     def _nested_serializers_forward(self):
-        field_info = model_meta.get_field_info(self.Meta.model)
         return {
             name: field
             for name, field in self._nested_serializers.items()
-            if name in field_info.forward_relations
+            if self._nesting_plan[name].forward
         }
 
     @cached_property
     def _nested_serializers_reverse(self):
-        field_info = model_meta.get_field_info(self.Meta.model)
         return {
             name: field
             for name, field in self._nested_serializers.items()
-            if name in field_info.reverse_relations
+            if self._nesting_plan[name].reverse
         }
 
     @cached_property
     def _nested_serializers(self):
+        return {
+            name: self.fields[relation.field_name]
+            for name, relation in self._nesting_plan.items()
+            if relation.field_name in self.fields
+        }
+
+    @cached_property
+    def _nesting_plan(self):
+        plans = type(self).__dict__.get("_compiled_nesting_plans")
+        if plans is None:
+            plans = type(self)._compiled_nesting_plans = {}
+        key = tuple(
+            (field.field_name, field.source, type(field), type(serializer))
+            for field in self.fields.values()
+            for serializer in [getattr(field, "child", field)]
+            if isinstance(serializer, ModelSerializer)
+        )
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = self._compile_nesting_plan()
+        return plan
+
+    def _compile_nesting_plan(self):
         include = getattr(self.Meta, INCLUDE_FIELD, None)
         exclude = getattr(self.Meta, EXCLUDE_FIELD, None)
 
@@ -238,28 +1101,706 @@ class NestedModelSerializer(ModelSerializer):
 
         # None, None
         if include is None and exclude is None:
-            return serializers
+            pass
         # ALL, (None, List)
         elif include == ALL_FIELDS:
-            return serializers
+            pass
         # (None, List), ALL
         elif exclude == ALL_FIELDS:
-            return {}
+            serializers = {}
         # List, None
         elif include is not None:
-            return {
+            serializers = {
                 name: field
                 for name, field in serializers.items()
                 if field.field_name in include
             }
         # None, List
         elif exclude is not None:
-            return {
+            serializers = {
                 name: field
                 for name, field in serializers.items()
                 if field.field_name not in exclude
             }
-        return {}
+
+        upsert_keys = getattr(self.Meta, UPSERT_KEYS_FIELD, {})
+        assert isinstance(upsert_keys, Mapping), (
+            f"The '{UPSERT_KEYS_FIELD}' option must be a mapping of field names to sequences. Got '{upsert_keys}'."
+        )
+        lookup_fields = getattr(self.Meta, LOOKUP_FIELDS_FIELD, {})
+        assert isinstance(lookup_fields, Mapping), (
+            f"The '{LOOKUP_FIELDS_FIELD}' option must be a mapping of field names to field names or sequences. Got '{lookup_fields}'."
+        )
+
+        field_info = model_meta.get_field_info(self.Meta.model)
+        return {
+            name: _compile_nested_relation(
+                self.Meta.model,
+                field_info,
+                field,
+                upsert_keys.get(field.field_name),
+                lookup_fields.get(field.field_name),
+            )
+            for name, field in serializers.items()
+        }
+
+
+class NestedListSerializer(ListSerializer):
+    def run_validation(self, data=empty):
+        if (
+            self.parent is None
+            and isinstance(self.child, NestedModelSerializer)
+            and isinstance(data, list)
+        ):
+            self.child._batch_lookup_primary_keys(data)
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        if (
+            self.parent is None
+            and isinstance(data, list)
+            and data
+            and (self.max_length is None or len(data) <= self.max_length)
+            and (self.min_length is None or len(data) >= self.min_length)
+        ):
+            self._parallel_results = self._validate_in_parallel(
+                [(None, item) for item in data]
+            )
+        try:
+            return super().to_internal_value(data)
+        finally:
+            self.__dict__.pop("_parallel_results", None)
+
+    def run_child_validation(self, data):
+        results = self.__dict__.get("_parallel_results")
+        result = next(results) if results is not None else None
+        if result is None and isinstance(self.parent, NestedModelSerializer):
+            return self.parent._validate_nested_entry(self.source, self.child, data)
+        if result is None:
+            return super().run_child_validation(data)
+        valid, value = result
+        if not valid:
+            raise ValidationError(value)
+        return value
+
+    async def ais_valid(self, *, raise_exception=False):
+        return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        return await sync_to_async(self.save)(**kwargs)
+
+    @property
+    def data(self):
+        child = self.child
+        written = None
+        if isinstance(child, NestedModelSerializer):
+            written = child.__dict__.get("_nested_written")
+        try:
+            with _written_caches(written):
+                return super().data
+        finally:
+            child.__dict__.pop("_nested_written", None)
+
+    def create(self, validated_data):
+        child = self.child
+        if (
+            not isinstance(child, NestedModelSerializer)
+            or type(child).create is not NestedModelSerializer.create
+        ):
+            return super().create(validated_data)
+
+        for data in validated_data:
+            child._pop_refresh_option(data)
+        return self._save_entries([(None, data) for data in validated_data])
+
+    def _validate_entries(self, items):
+        child = self.child
+        model = child.Meta.model
+        pk_name = model._meta.pk.attname
+        pks = [
+            _to_primary_key(model, item.get(pk_name))
+            if isinstance(item, Mapping)
+            else None
+            for item in items
+        ]
+        instances = _get_identity_map(self).fetch(
+            model, {pk for pk in pks if pk is not None}
+        )
+        child._batch_lookup_primary_keys(items)
+
+        entries = []
+        errors = []
+        pending = []
+        error_messages = getattr(child.fields.get(pk_name), "error_messages", {})
+        if not {"does_not_exist", "incorrect_type"} <= error_messages.keys():
+            error_messages = PrimaryKeyRelatedField.default_error_messages
+        for index, (item, pk) in enumerate(zip(items, pks)):
+            value = item.get(pk_name) if isinstance(item, Mapping) else None
+            if pk is None and value is not None:
+                message = error_messages["incorrect_type"].format(
+                    data_type=type(value).__name__
+                )
+                errors.append((index, {pk_name: [message]}))
+                continue
+            instance = None if pk is None else instances[pk]
+            if pk is not None and instance is None:
+                message = error_messages["does_not_exist"].format(
+                    pk_value=item[pk_name]
+                )
+                errors.append((index, {pk_name: [message]}))
+                continue
+            pending.append((index, instance, item))
+
+        results = self._validate_in_parallel(
+            [(instance, item) for _, instance, item in pending]
+        )
+        for index, instance, item in pending:
+            result = next(results) if results is not None else None
+            if result is None:
+                child.instance = instance
+                try:
+                    result = (True, self.run_child_validation(item))
+                except ValidationError as exc:
+                    result = (False, exc.detail)
+            valid, value = result
+            if valid:
+                entries.append((instance, value))
+            else:
+                errors.append((index, value))
+        child.instance = None
+        errors.sort(key=lambda error: error[0])
+        return entries, errors
+
+    def _validate_in_parallel(self, entries):
+        child = self.child
+        workers = getattr(getattr(child, "Meta", None), VALIDATION_WORKERS_FIELD, None)
+        if not isinstance(child, NestedModelSerializer) or not workers:
+            return None
+        assert isinstance(workers, int) and workers > 0, (
+            f"The '{VALIDATION_WORKERS_FIELD}' option must be a positive integer. Got '{workers}'."
+        )
+        if workers == 1 or len(entries) < 2:
+            return None
+        identity_map = _get_identity_map(self)
+        kwargs = {
+            key: value
+            for key, value in getattr(child, "_kwargs", {}).items()
+            if key not in ("data", "instance", "context", "many")
+        }
+        kwargs["partial"] = self.partial
+        try:
+            pickle.dumps((type(child), kwargs, self.context, identity_map))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+
+        size = -(-len(entries) // workers)
+        shards = [entries[i : i + size] for i in range(0, len(entries), size)]
+        with ProcessPoolExecutor(
+            max_workers=len(shards), initializer=_setup_validation_worker
+        ) as executor:
+            results = executor.map(
+                partial(
+                    _validate_shard, type(child), kwargs, self.context, identity_map
+                ),
+                shards,
+            )
+            results = [result for shard in results for result in shard]
+        return iter(
+            result and (result[0], _merge_identities(identity_map, result[1]))
+            for result in results
+        )
+
+    def _save_entries(self, entries):
+        child = self.child
+        with child._atomic():
+            instances = child._save_batch(entries)
+            child._invalidate_representation_caches()
+        return instances
+
+
+_NestedRelation = namedtuple(
+    "_NestedRelation",
+    (
+        "field_name",
+        "source",
+        "model_field",
+        "forward",
+        "reverse",
+        "many",
+        "pk_name",
+        "related_name",
+        "null",
+        "serializer_class",
+        "to_many",
+        "upsert_keys",
+        "lookup_fields",
+    ),
+)
+
+
+def _compile_nested_relation(
+    model, field_info, field, upsert_keys=None, lookup_fields=None
+):
+    serializer = field
+    if isinstance(field, ListSerializer):
+        serializer = field.child
+
+    forward = field.source in field_info.forward_relations
+    reverse = field.source in field_info.reverse_relations
+    model_field = None
+    related_name = None
+    null = None
+    if forward:
+        model_field = model._meta.get_field(field.source)
+        null = model_field.null
+    elif reverse:
+        model_field = model._meta.get_field(field.source)
+        related_name = model_field.field.name
+        null = model_field.field.null
+
+    nested_model = serializer.Meta.model
+    nested_field_info = model_meta.get_field_info(nested_model)
+    to_many = frozenset(
+        name for name, info in nested_field_info.relations.items() if info.to_many
+    )
+
+    if isinstance(lookup_fields, str):
+        lookup_fields = (lookup_fields,)
+    lookup_fields = tuple(lookup_fields or ())
+    for name in lookup_fields:
+        assert _get_concrete_field(nested_model, name) is not None, (
+            f"The '{LOOKUP_FIELDS_FIELD}' option of '{field.field_name}' names '{name}', which is not a concrete field of '{nested_model.__name__}'."
+        )
+
+    return _NestedRelation(
+        field_name=field.field_name,
+        source=field.source,
+        model_field=model_field,
+        forward=forward,
+        reverse=reverse,
+        many=isinstance(field, ListSerializer),
+        pk_name=_get_pk_name(serializer),
+        related_name=related_name,
+        null=null,
+        serializer_class=type(serializer),
+        to_many=to_many,
+        upsert_keys=tuple(upsert_keys or ()),
+        lookup_fields=lookup_fields,
+    )
+
+
+_EagerLoading = namedtuple(
+    "_EagerLoading", ("select_related", "prefetch_related", "only")
+)
+
+
+def _compile_eager_loading(serializer, required=()):
+    select_related = []
+    prefetch_related = []
+    only = list(required)
+    _collect_eager_loading(serializer, "", select_related, prefetch_related, only)
+    return _EagerLoading(
+        tuple(select_related), tuple(prefetch_related), tuple(dict.fromkeys(only))
+    )
+
+
+def _collect_eager_loading(serializer, prefix, select_related, prefetch_related, only):
+    model = serializer.Meta.model
+    only.append(prefix + model._meta.pk.name)
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        nested = field
+        if isinstance(field, ListSerializer):
+            nested = field.child
+        model_field = None
+        if len(field.source_attrs) == 1:
+            model_field = _get_relation_field(model, field.source)
+
+        if model_field is None or not isinstance(nested, ModelSerializer):
+            _collect_columns(model, field, prefix, only)
+            continue
+
+        path = prefix + field.source
+        if model_field.many_to_many or model_field.one_to_many:
+            required = ()
+            if isinstance(model_field, models.ManyToOneRel):
+                required = (model_field.field.name,)
+            prefetch_related.append(
+                (path, nested.Meta.model, _compile_eager_loading(nested, required))
+            )
+        else:
+            if model_field.concrete:
+                only.append(path)
+            select_related.append(path)
+            _collect_eager_loading(
+                nested, path + "__", select_related, prefetch_related, only
+            )
+
+
+def _collect_columns(model, field, prefix, only):
+    if len(field.source_attrs) == 1:
+        if _get_concrete_field(model, field.source) is not None:
+            only.append(prefix + field.source)
+            return
+        if _get_relation_field(model, field.source) is not None:
+            return
+    # Fields with other sources may read any column
+    only.extend(prefix + f.name for f in model._meta.concrete_fields)
+
+
+def _apply_eager_loading(queryset, eager_loading):
+    if eager_loading.select_related:
+        queryset = queryset.select_related(*eager_loading.select_related)
+    if eager_loading.prefetch_related:
+        queryset = queryset.prefetch_related(
+            *(
+                models.Prefetch(
+                    path,
+                    queryset=_apply_eager_loading(
+                        model._default_manager.all(), nested_eager_loading
+                    ),
+                )
+                for path, model, nested_eager_loading in eager_loading.prefetch_related
+            )
+        )
+    return queryset.only(*eager_loading.only)
+
+
+@contextmanager
+def _written_caches(written):
+    if not written:
+        yield
+        return
+    _set_written_caches(written)
+    try:
+        yield
+    finally:
+        _delete_written_caches(written)
+
+
+def _set_written_caches(written):
+    for instance, source, model_field, value in written:
+        if not (model_field.many_to_many or model_field.one_to_many):
+            model_field.set_cached_value(instance, value)
+            continue
+
+        prefetched_objects_cache = instance.__dict__.setdefault(
+            "_prefetched_objects_cache", {}
+        )
+        cache_name = _get_prefetch_cache_name(model_field)
+        prefetched_objects_cache.pop(cache_name, None)
+        queryset = getattr(instance, source).all()
+        queryset._result_cache = value
+        queryset._prefetch_done = True
+        prefetched_objects_cache[cache_name] = queryset
+
+
+def _delete_written_caches(written):
+    for instance, _, model_field, _ in written:
+        if not (model_field.many_to_many or model_field.one_to_many):
+            if model_field.is_cached(instance):
+                model_field.delete_cached_value(instance)
+        else:
+            cache_name = _get_prefetch_cache_name(model_field)
+            instance._prefetched_objects_cache.pop(cache_name, None)
+
+
+def _collect_cache_dependencies(serializer, labels):
+    labels.add(serializer.Meta.model._meta.label_lower)
+    for field in serializer.fields.values():
+        nested = field
+        if isinstance(field, ListSerializer):
+            nested = field.child
+        if not field.write_only and isinstance(nested, ModelSerializer):
+            _collect_cache_dependencies(nested, labels)
+
+
+def _get_cache_versions(root, alias, labels):
+    versions = root.__dict__.setdefault("_nested_cache_versions", {})
+    versions = versions.setdefault(alias, {})
+    missing = {_get_cache_version_key(label): label for label in labels}
+    missing = {key: label for key, label in missing.items() if label not in versions}
+    if missing:
+        cache = caches[alias]
+        found = cache.get_many(missing)
+        created = {key: uuid4().hex for key in missing if key not in found}
+        if created:
+            cache.set_many(created, None)
+        for key, label in missing.items():
+            versions[label] = found.get(key) or created[key]
+    return [versions[label] for label in labels]
+
+
+def _bump_cache_versions(labels):
+    for alias in _representation_cache_aliases:
+        caches[alias].set_many(
+            {_get_cache_version_key(label): uuid4().hex for label in labels}, None
+        )
+
+
+def _get_cache_version_key(label):
+    return f"{_CACHE_KEY_PREFIX}:version:{label}"
+
+
+def _get_prefetch_cache_name(model_field):
+    if isinstance(model_field, models.ManyToManyRel):
+        return model_field.field.related_query_name()
+    if isinstance(model_field, models.ForeignObjectRel):
+        return model_field.get_accessor_name()
+    return model_field.name
+
+
+def _get_relation_field(model, name):
+    for field in model._meta.get_fields():
+        if not field.is_relation or field.related_model is None:
+            continue
+        if isinstance(field, models.ForeignObjectRel):
+            accessor_name = field.get_accessor_name()
+        else:
+            accessor_name = field.name
+        if accessor_name == name:
+            return field
+    return None
+
+
+def _can_bulk_insert(model):
+    if model._meta.parents:
+        return False
+    connection = connections[router.db_for_write(model)]
+    return connection.features.can_return_rows_from_bulk_insert
+
+
+def _refresh_instances(instances, fields=None):
+    model = type(instances[0])
+    queryset = model._base_manager.db_manager(instances[0]._state.db).filter(
+        pk__in={instance.pk for instance in instances}
+    )
+    if fields is not None:
+        queryset = queryset.only(*fields)
+    db_instances = {db_instance.pk: db_instance for db_instance in queryset}
+
+    for instance in instances:
+        db_instance = db_instances.get(instance.pk)
+        if db_instance is None:
+            continue
+        deferred_fields = db_instance.get_deferred_fields()
+        for field in model._meta.concrete_fields:
+            if field.attname in deferred_fields:
+                continue
+            setattr(instance, field.attname, getattr(db_instance, field.attname))
+            if field.is_relation and field.is_cached(instance):
+                field.delete_cached_value(instance)
+        for field in model._meta.related_objects:
+            if field.is_cached(instance):
+                field.delete_cached_value(instance)
+        if fields is None:
+            instance._prefetched_objects_cache = {}
+
+
+def _get_concrete_field(model, name):
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.many_to_many:
+        return None
+    return field
+
+
+def _assign_changed_fields(instance, validated_data):
+    changed = []
+    for name, value in validated_data.items():
+        field = _get_concrete_field(type(instance), name)
+        previous = getattr(instance, field.attname)
+        if field.is_relation:
+            value_key = value if value is None else value.pk
+        else:
+            value_key = value
+        if previous != value_key:
+            changed.append(field.name)
+        setattr(instance, name, value)
+
+    if changed:
+        for field in instance._meta.concrete_fields:
+            if getattr(field, "auto_now", False) and field.name not in changed:
+                field.pre_save(instance, add=False)
+                changed.append(field.name)
+    return changed
+
+
+def _update_changed_fields(serializer, instance, validated_data):
+    raise_errors_on_nested_writes("update", serializer, validated_data)
+    info = model_meta.get_field_info(instance)
+    values = {}
+    m2m_fields = []
+    for attr, value in validated_data.items():
+        if attr in info.relations and info.relations[attr].to_many:
+            m2m_fields.append((attr, value))
+        else:
+            values[attr] = value
+
+    model = type(instance)
+    if all(_get_concrete_field(model, attr) is not None for attr in values):
+        changed = _assign_changed_fields(instance, values)
+        if changed:
+            instance.save(update_fields=changed)
+    else:
+        for attr, value in values.items():
+            setattr(instance, attr, value)
+        instance.save()
+
+    for attr, value in m2m_fields:
+        getattr(instance, attr).set(value)
+    return instance
+
+
+def _get_representation_reader(serializer):
+    reader = serializer.__dict__.get("_representation_reader")
+    if reader is None:
+        reader = serializer._representation_reader = tuple(
+            _compile_representation_getter(serializer.Meta.model, field)
+            for field in serializer._readable_fields
+        )
+    return reader
+
+
+def _compile_representation_getter(model, field):
+    if len(field.source_attrs) == 1:
+        model_field = _get_concrete_field(model, field.source)
+    else:
+        model_field = None
+
+    if model_field is None:
+        pass
+    elif not model_field.is_relation:
+        if type(field).get_attribute is Field.get_attribute:
+            getter = attrgetter(model_field.attname)
+            return (field.field_name, getter, field.to_representation, field)
+    elif (
+        isinstance(field, PrimaryKeyRelatedField)
+        and field.pk_field is None
+        and field.use_pk_only_optimization()
+        and type(field).get_attribute is PrimaryKeyRelatedField.get_attribute
+        and type(field).to_representation is PrimaryKeyRelatedField.to_representation
+    ):
+        return (field.field_name, attrgetter(model_field.attname), None, field)
+    return (field.field_name, None, _get_nested_converter(field), field)
+
+
+def _get_nested_converter(field):
+    serializer = field
+    if isinstance(field, ListSerializer):
+        if type(field).to_representation is not ListSerializer.to_representation:
+            return None
+        serializer = field.child
+    if not isinstance(serializer, ModelSerializer):
+        return None
+    if type(serializer).to_representation is not Serializer.to_representation:
+        return None
+    if serializer is field:
+        return partial(_read_nested_representation, serializer)
+    return partial(_read_nested_list_representation, serializer)
+
+
+def _read_nested_representation(serializer, instance):
+    if not isinstance(instance, models.Model):
+        return serializer.to_representation(instance)
+    return _read_representation(_get_representation_reader(serializer), instance)
+
+
+def _read_nested_list_representation(serializer, data):
+    if isinstance(data, models.manager.BaseManager):
+        data = data.all()
+    return [_read_nested_representation(serializer, item) for item in data]
+
+
+def _read_representation(reader, instance):
+    ret = {}
+    for field_name, getter, converter, field in reader:
+        if getter is not None:
+            value = getter(instance)
+            if value is not None and converter is not None:
+                value = converter(value)
+            ret[field_name] = value
+            continue
+
+        try:
+            attribute = field.get_attribute(instance)
+        except SkipField:
+            continue
+        if isinstance(attribute, PKOnlyObject):
+            check_for_none = attribute.pk
+        else:
+            check_for_none = attribute
+        if check_for_none is None:
+            ret[field_name] = None
+        elif converter is not None:
+            ret[field_name] = converter(attribute)
+        else:
+            ret[field_name] = field.to_representation(attribute)
+    return ret
+
+
+def _get_lookup_key(model, fields, data):
+    key = []
+    for name in fields:
+        value = data.get(name)
+        if value is None:
+            return None
+        try:
+            key.append(model._meta.get_field(name).to_python(value))
+        except (DjangoValidationError, TypeError, ValueError):
+            return None
+    return tuple(key)
+
+
+class _DatabaseAccess(Exception):
+    pass
+
+
+def _block_database_access(execute, sql, params, many, context):
+    raise _DatabaseAccess(sql)
+
+
+def _setup_validation_worker():
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def _validate_shard(serializer_class, kwargs, context, identity_map, entries):
+    child = serializer_class(context=context, **kwargs)
+    serializer = NestedListSerializer(
+        child=child, context=context, partial=kwargs["partial"]
+    )
+    serializer._nested_identity_map = identity_map
+    results = []
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(_block_database_access))
+        for instance, item in entries:
+            child.instance = instance
+            try:
+                results.append((True, child.run_validation(item)))
+            except ValidationError as exc:
+                results.append((False, exc.detail))
+            except _DatabaseAccess:
+                results.append(None)
+    return results
+
+
+def _merge_identities(identity_map, value):
+    if isinstance(value, models.Model):
+        return identity_map.add(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _merge_identities(identity_map, item)
+    elif isinstance(value, list):
+        value[:] = [_merge_identities(identity_map, item) for item in value]
+    return value
 
 
 def _get_pk_name(serializer):
@@ -267,3 +1808,24 @@ def _get_pk_name(serializer):
         serializer = serializer.child
 
     return serializer.Meta.model._meta.pk.attname
+
+
+def _get_identity_map(field):
+    root = field.root
+    identity_map = getattr(root, "_nested_identity_map", None)
+    if identity_map is None:
+        identity_map = root._nested_identity_map = _IdentityMap()
+    return identity_map
+
+
+def _identity_key(model, pk):
+    return (model._meta.concrete_model, pk)
+
+
+def _to_primary_key(model, value):
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return model._meta.pk.to_python(value)
+    except (DjangoValidationError, TypeError, ValueError):
+        return None
@@ -1,10 +1,67 @@
-from rest_framework.serializers import ModelSerializer
+from typing import NamedTuple
+
+from rest_framework.serializers import (
+    ListSerializer,
+    ModelSerializer,
+    PrimaryKeyRelatedField,
+)
 
 INCLUDE_FIELD: str
 EXCLUDE_FIELD: str
+BATCH_LOOKUP_FIELD: str
+BULK_FIELD: str
+REFRESH_FIELD: str
+ATOMIC_FIELD: str
+SAVEPOINTS_FIELD: str
+CACHE_FIELD: str
+CACHE_TIMEOUT_FIELD: str
+UPSERT_KEYS_FIELD: str
+LOOKUP_FIELDS_FIELD: str
+VALIDATION_WORKERS_FIELD: str
 ALL_FIELDS: str
+REFRESH_NONE: str
+REFRESH_TOP_LEVEL: str
+REFRESH_FULL: str
+SAVEPOINTS_NONE: str
+SAVEPOINTS_LEVEL: str
+SAVEPOINTS_ENTRY: str
+ON_ERROR_RAISE: str
+ON_ERROR_SKIP: str
+
+class BulkSaveSummary(NamedTuple):
+    created: int
+    updated: int
+    failed: int
+    errors: list
+
+class NestedPrimaryKeyRelatedField(PrimaryKeyRelatedField):
+    def __init__(self, **kwargs) -> None: ...
+    def batch_lookup(self, values) -> None: ...
+    def to_internal_value(self, data): ...
 
 class NestedModelSerializer(ModelSerializer):
     def __init__(self, *args, **kwargs) -> None: ...
+    def run_validation(self, data=...): ...
+    async def ais_valid(self, *, raise_exception: bool = ...) -> bool: ...
+    async def asave(self, **kwargs): ...
+    def to_representation(self, instance): ...
+    @property
+    def data(self): ...
     def create(self, validated_data) -> None: ...
     def update(self, instance, validated_data) -> None: ...
+    @classmethod
+    def setup_eager_loading(cls, queryset): ...
+    @classmethod
+    def stream(cls, queryset, chunk_size: int = ..., **kwargs): ...
+    @classmethod
+    def bulk_save(
+        cls, iterable, chunk_size: int = ..., on_error=..., context=...
+    ) -> BulkSaveSummary: ...
+
+class NestedListSerializer(ListSerializer):
+    def run_validation(self, data=...): ...
+    async def ais_valid(self, *, raise_exception: bool = ...) -> bool: ...
+    async def asave(self, **kwargs): ...
+    @property
+    def data(self): ...
+    def create(self, validated_data): ...
@@ -0,0 +1,101 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class AsyncNestedModel(models.Model):
+    name = models.CharField()
+
+
+class AsyncParentModel(models.Model):
+    name = models.CharField()
+    nested = models.ForeignKey(AsyncNestedModel, on_delete=models.CASCADE)
+
+
+class AsyncChildModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        AsyncParentModel, related_name="children", on_delete=models.CASCADE
+    )
+
+
+class AsyncNestedSerializer(ModelSerializer):
+    class Meta:
+        model = AsyncNestedModel
+        fields = ("id", "name")
+
+
+class AsyncChildSerializer(ModelSerializer):
+    class Meta:
+        model = AsyncChildModel
+        fields = ("id", "name")
+
+
+class AsyncParentSerializer(NestedModelSerializer):
+    nested = AsyncNestedSerializer()
+    children = AsyncChildSerializer(many=True)
+
+    class Meta:
+        model = AsyncParentModel
+        fields = ("id", "name", "nested", "children")
+
+
+class AsyncTest(TestCase):
+    async def test_create_update(self):
+        data = {
+            "name": "Parent",
+            "nested": {"name": "Nested"},
+            "children": [{"name": "Child 1"}, {"name": "Child 2"}],
+        }
+
+        serializer = AsyncParentSerializer(data=data)
+        assert await serializer.ais_valid(), serializer.errors
+        instance = await serializer.asave()
+
+        data = {
+            "name": "Updated",
+            "nested": {"id": instance.nested_id, "name": "Nested 2"},
+            "children": [{"name": "Child 3"}],
+        }
+        serializer = AsyncParentSerializer(data=data, instance=instance)
+        assert await serializer.ais_valid(), serializer.errors
+        await serializer.asave()
+
+        result = (
+            await AsyncParentModel.objects.filter(pk=instance.pk)
+            .values_list("name", "nested__name")
+            .aget(),
+            [
+                name
+                async for name in AsyncChildModel.objects.values_list("name", flat=True)
+            ],
+        )
+        expected = (("Updated", "Nested 2"), ["Child 3"])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    async def test_many(self):
+        data = [
+            {"name": "Parent 1", "nested": {"name": "Nested 1"}, "children": []},
+            {"name": "Parent 2", "nested": {"name": "Nested 2"}, "children": []},
+        ]
+
+        serializer = AsyncParentSerializer(data=data, many=True)
+        assert await serializer.ais_valid(), serializer.errors
+        await serializer.asave()
+
+        result = [
+            name
+            async for name in AsyncParentModel.objects.order_by("pk").values_list(
+                "name", flat=True
+            )
+        ]
+        expected = ["Parent 1", "Parent 2"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    async def test_raise_exception(self):
+        serializer = AsyncParentSerializer(data={})
+        with self.assertRaises(ValidationError):
+            await serializer.ais_valid(raise_exception=True)
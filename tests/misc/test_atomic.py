@@ -0,0 +1,141 @@
+from django.db import IntegrityError, connection, transaction
+from django.db import models
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class AtomicParentModel(models.Model):
+    pass
+
+
+class AtomicNestedModel(models.Model):
+    name = models.CharField(unique=True)
+    parent = models.ForeignKey(
+        AtomicParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class AtomicNestedSerializer(ModelSerializer):
+    class Meta:
+        model = AtomicNestedModel
+        fields = ("id", "name")
+        extra_kwargs = {"name": {"validators": []}}
+
+
+class AtomicParentSerializer(NestedModelSerializer):
+    nested = AtomicNestedSerializer(many=True)
+
+    class Meta:
+        model = AtomicParentModel
+        fields = ("id", "nested")
+        nested_bulk = False
+
+
+class NonAtomicParentSerializer(AtomicParentSerializer):
+    class Meta(AtomicParentSerializer.Meta):
+        nested_atomic = False
+
+
+class LevelParentSerializer(AtomicParentSerializer):
+    class Meta(AtomicParentSerializer.Meta):
+        nested_savepoints = "level"
+
+
+class EntryParentSerializer(AtomicParentSerializer):
+    class Meta(AtomicParentSerializer.Meta):
+        nested_savepoints = "entry"
+
+
+class NonAtomicLevelParentSerializer(NonAtomicParentSerializer):
+    class Meta(NonAtomicParentSerializer.Meta):
+        nested_savepoints = "level"
+
+
+class NonAtomicEntryParentSerializer(NonAtomicParentSerializer):
+    class Meta(NonAtomicParentSerializer.Meta):
+        nested_savepoints = "entry"
+
+
+class AtomicTest(TransactionTestCase):
+    data = {"nested": [{"name": "Foo"}, {"name": "Foo"}]}
+
+    def test_rollback(self):
+        serializer = AtomicParentSerializer(data=self.data)
+        assert serializer.is_valid(), serializer.errors
+        with self.assertRaises(IntegrityError):
+            serializer.save()
+
+        result = AtomicParentModel.objects.count()
+        expected = 0
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_no_rollback(self):
+        serializer = NonAtomicParentSerializer(data=self.data)
+        assert serializer.is_valid(), serializer.errors
+        with self.assertRaises(IntegrityError):
+            serializer.save()
+
+        result = AtomicParentModel.objects.count()
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_outer_transaction(self):
+        serializer = AtomicParentSerializer(data=self.data)
+        assert serializer.is_valid(), serializer.errors
+        with transaction.atomic():
+            with self.assertRaises(IntegrityError):
+                serializer.save()
+
+            result = AtomicParentModel.objects.count()
+            expected = 0
+            assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def _save_non_atomic(self, serializer_class):
+        serializer = serializer_class(data=self.data)
+        assert serializer.is_valid(), serializer.errors
+        with self.assertRaises(IntegrityError):
+            serializer.save()
+        return (AtomicParentModel.objects.count(), AtomicNestedModel.objects.count())
+
+    def test_no_savepoints_isolation(self):
+        result = self._save_non_atomic(NonAtomicParentSerializer)
+        expected = (1, 1)
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_level_isolation(self):
+        result = self._save_non_atomic(NonAtomicLevelParentSerializer)
+        expected = (1, 0)
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_entry_isolation(self):
+        result = self._save_non_atomic(NonAtomicEntryParentSerializer)
+        expected = (1, 1)
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+
+class SavepointCountTest(TestCase):
+    def _count_savepoints(self, serializer_class):
+        data = {"nested": [{"name": f"Nested {i}"} for i in range(3)]}
+        serializer = serializer_class(data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        return sum(query["sql"].startswith("SAVEPOINT") for query in queries)
+
+    def test_none(self):
+        result = self._count_savepoints(AtomicParentSerializer)
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_level(self):
+        result = self._count_savepoints(LevelParentSerializer)
+        expected = 2
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_entry(self):
+        result = self._count_savepoints(EntryParentSerializer)
+        expected = 4
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,72 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class BatchLookupParentModel(models.Model):
+    pass
+
+
+class BatchLookupNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        BatchLookupParentModel,
+        related_name="nested",
+        on_delete=models.CASCADE,
+        null=True,
+    )
+
+
+class BatchLookupNestedSerializer(ModelSerializer):
+    class Meta:
+        model = BatchLookupNestedModel
+        fields = ("id", "name")
+
+
+class BatchLookupParentSerializer(NestedModelSerializer):
+    nested = BatchLookupNestedSerializer(many=True, required=False)
+
+    class Meta:
+        model = BatchLookupParentModel
+        fields = ("id", "nested")
+
+
+class UnbatchedLookupParentSerializer(NestedModelSerializer):
+    nested = BatchLookupNestedSerializer(many=True, required=False)
+
+    class Meta:
+        model = BatchLookupParentModel
+        fields = ("id", "nested")
+        nested_batch_lookup = False
+
+
+class BatchLookupTest(TestCase):
+    def test_one_query_per_list(self):
+        for i in range(1, 11):
+            BatchLookupNestedModel.objects.create(id=i, name=f"Nested {i}")
+        data = {"nested": [{"id": i} for i in range(1, 11)]}
+
+        serializer = BatchLookupParentSerializer(data=data)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+        result = [entry["id"] for entry in serializer.validated_data["nested"]]
+        expected = list(BatchLookupNestedModel.objects.order_by("id"))
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_does_not_exist(self):
+        BatchLookupNestedModel.objects.create(id=1, name="Max Mustermann")
+        data = {"nested": [{"id": 1}, {"id": "99"}, {"id": "abc"}]}
+
+        serializer = BatchLookupParentSerializer(data=data)
+        assert not serializer.is_valid()
+        result = serializer.errors
+
+        serializer = UnbatchedLookupParentSerializer(data=data)
+        assert not serializer.is_valid()
+        expected = serializer.errors
+
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert "99" in str(result["nested"][1]["id"][0])
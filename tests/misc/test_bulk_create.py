@@ -0,0 +1,66 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class BulkCreateParentModel(models.Model):
+    pass
+
+
+class BulkCreateNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        BulkCreateParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class BulkCreateNestedSerializer(ModelSerializer):
+    class Meta:
+        model = BulkCreateNestedModel
+        fields = ("id", "name")
+
+
+class BulkCreateParentSerializer(NestedModelSerializer):
+    nested = BulkCreateNestedSerializer(many=True)
+
+    class Meta:
+        model = BulkCreateParentModel
+        fields = ("id", "nested")
+
+
+class NoBulkCreateParentSerializer(NestedModelSerializer):
+    nested = BulkCreateNestedSerializer(many=True)
+
+    class Meta:
+        model = BulkCreateParentModel
+        fields = ("id", "nested")
+        nested_bulk = False
+
+
+class BulkCreateTest(TestCase):
+    def _save(self, serializer_class, count):
+        data = {"nested": [{"name": f"Nested {i}"} for i in range(count)]}
+        serializer = serializer_class(data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            instance = serializer.save()
+        return instance, len(queries)
+
+    def test_constant_queries(self):
+        _, small = self._save(BulkCreateParentSerializer, 10)
+        instance, large = self._save(BulkCreateParentSerializer, 200)
+        assert small == large, f"{small} != {large}"
+
+        result = BulkCreateParentSerializer(instance=instance).data["nested"]
+        expected = [f"Nested {i}" for i in range(200)]
+        assert [entry["name"] for entry in result] == expected
+        assert all(entry["id"] is not None for entry in result)
+
+    def test_disabled(self):
+        _, small = self._save(NoBulkCreateParentSerializer, 10)
+        _, large = self._save(NoBulkCreateParentSerializer, 20)
+        assert large - small == 10, f"{small}, {large}"
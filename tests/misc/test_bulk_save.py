@@ -0,0 +1,133 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import (
+    BulkSaveSummary,
+    NestedModelSerializer,
+)
+
+
+class BulkSaveParentModel(models.Model):
+    name = models.CharField(max_length=10)
+
+
+class BulkSaveNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        BulkSaveParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class BulkSaveNestedSerializer(ModelSerializer):
+    class Meta:
+        model = BulkSaveNestedModel
+        fields = ("id", "name")
+
+
+class BulkSaveParentSerializer(NestedModelSerializer):
+    nested = BulkSaveNestedSerializer(many=True)
+
+    class Meta:
+        model = BulkSaveParentModel
+        fields = ("id", "name", "nested")
+
+
+class BulkSaveContextSerializer(BulkSaveParentSerializer):
+    def validate(self, attrs):
+        assert self.context.get("request") is None
+        return attrs
+
+
+def payloads(count, invalid=()):
+    for i in range(count):
+        name = "Too long name" if i in invalid else f"Parent {i}"
+        yield {"name": name, "nested": [{"name": f"Nested {i}"}]}
+
+
+class BulkSaveTest(TestCase):
+    def test_create(self):
+        result = BulkSaveParentSerializer.bulk_save(payloads(25), chunk_size=10)
+        expected = BulkSaveSummary(created=25, updated=0, failed=0, errors=[])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = BulkSaveNestedModel.objects.count()
+        expected = 25
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_update(self):
+        parent = BulkSaveParentModel.objects.create(name="Parent")
+        BulkSaveNestedModel.objects.create(parent=parent, name="Old")
+        data = [{"id": parent.pk, "name": "Updated", "nested": [{"name": "New"}]}]
+
+        result = BulkSaveParentSerializer.bulk_save(data)
+        expected = BulkSaveSummary(created=0, updated=1, failed=0, errors=[])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        parent.refresh_from_db()
+        result = (parent.name, [nested.name for nested in parent.nested.all()])
+        expected = ("Updated", ["New"])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_skip(self):
+        result = BulkSaveParentSerializer.bulk_save(
+            payloads(25, invalid=(3, 17)), chunk_size=10, on_error="skip"
+        )
+        assert result.created == 23, result
+        assert result.failed == 2, result
+        assert [index for index, _ in result.errors] == [3, 17], result
+
+        result = BulkSaveParentModel.objects.count()
+        expected = 23
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_raise(self):
+        with self.assertRaises(ValidationError) as context:
+            BulkSaveParentSerializer.bulk_save(
+                payloads(25, invalid=(17,)), chunk_size=10
+            )
+        assert list(context.exception.detail) == [17], context.exception.detail
+
+        result = BulkSaveParentModel.objects.count()
+        expected = 10
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_callable(self):
+        failures = []
+        result = BulkSaveParentSerializer.bulk_save(
+            payloads(5, invalid=(1,)),
+            on_error=lambda index, data, errors: failures.append((index, data)),
+        )
+        expected = BulkSaveSummary(created=4, updated=0, failed=1, errors=[])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert failures == [
+            (1, {"name": "Too long name", "nested": [{"name": "Nested 1"}]})
+        ]
+
+    def test_missing_pk(self):
+        result = BulkSaveParentSerializer.bulk_save(
+            [{"id": 99, "name": "Parent", "nested": []}], on_error="skip"
+        )
+        assert result.failed == 1, result
+        result = result.errors[0][1]
+        expected = {"id": ['Invalid pk "99" - object does not exist.']}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_invalid_pk(self):
+        result = BulkSaveParentSerializer.bulk_save(
+            [{"id": "abc", "name": "Parent", "nested": []}], on_error="skip"
+        )
+        assert result.failed == 1, result
+        assert result.created == 0, result
+        result = result.errors[0][1]
+        expected = {"id": ["Incorrect type. Expected pk value, received str."]}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = BulkSaveParentModel.objects.count()
+        expected = 0
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_default_context(self):
+        result = BulkSaveContextSerializer.bulk_save(payloads(2))
+        assert result.created == 2, result
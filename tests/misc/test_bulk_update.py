@@ -0,0 +1,82 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class BulkUpdateParentModel(models.Model):
+    pass
+
+
+class BulkUpdateNestedModel(models.Model):
+    name = models.CharField()
+    amount = models.IntegerField(default=0)
+    parent = models.ForeignKey(
+        BulkUpdateParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class BulkUpdateNestedSerializer(ModelSerializer):
+    class Meta:
+        model = BulkUpdateNestedModel
+        fields = ("id", "name", "amount")
+
+
+class BulkUpdateParentSerializer(NestedModelSerializer):
+    nested = BulkUpdateNestedSerializer(many=True)
+
+    class Meta:
+        model = BulkUpdateParentModel
+        fields = ("id", "nested")
+
+
+class BulkUpdateTest(TestCase):
+    def _save(self, parent, data):
+        serializer = BulkUpdateParentSerializer(instance=parent, data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        return [query["sql"] for query in queries]
+
+    def test_changed_columns(self):
+        parent = BulkUpdateParentModel.objects.create()
+        BulkUpdateNestedModel.objects.bulk_create(
+            BulkUpdateNestedModel(id=i, name=f"Nested {i}", parent=parent)
+            for i in range(1, 51)
+        )
+        data = {"nested": [{"id": i, "name": f"Nested {i}"} for i in range(1, 51)]}
+        data["nested"][3]["name"] = "Changed"
+        data["nested"][7]["name"] = "Changed"
+        data["nested"][9]["amount"] = 5
+
+        queries = self._save(parent, data)
+        updates = [sql for sql in queries if " CASE WHEN " in sql]
+        assert len(updates) == 2, updates
+
+        expected = {4: ("Changed", 0), 8: ("Changed", 0), 10: ("Nested 10", 5)}
+        for instance in BulkUpdateNestedModel.objects.all():
+            name, amount = expected.get(instance.id, (f"Nested {instance.id}", 0))
+            assert instance.name == name and instance.amount == amount, instance
+
+    def test_constant_queries(self):
+        small_parent = BulkUpdateParentModel.objects.create()
+        large_parent = BulkUpdateParentModel.objects.create()
+        BulkUpdateNestedModel.objects.bulk_create(
+            BulkUpdateNestedModel(
+                id=i,
+                name=f"Nested {i}",
+                parent=small_parent if i <= 10 else large_parent,
+            )
+            for i in range(1, 111)
+        )
+
+        small = self._save(
+            small_parent, {"nested": [{"id": i, "name": "A"} for i in range(1, 11)]}
+        )
+        large = self._save(
+            large_parent, {"nested": [{"id": i, "name": "B"} for i in range(11, 111)]}
+        )
+        assert len(small) == len(large), f"\n{small}\n{large}"
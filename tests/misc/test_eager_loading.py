@@ -0,0 +1,154 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class EagerLoadingOwnerModel(models.Model):
+    name = models.CharField()
+    description = models.TextField(default="")
+
+
+class EagerLoadingTagModel(models.Model):
+    name = models.CharField()
+
+
+class EagerLoadingParentModel(models.Model):
+    owner = models.ForeignKey(EagerLoadingOwnerModel, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(EagerLoadingTagModel)
+
+
+class EagerLoadingChildModel(models.Model):
+    parent = models.ForeignKey(
+        EagerLoadingParentModel, related_name="children", on_delete=models.CASCADE
+    )
+    owner = models.ForeignKey(EagerLoadingOwnerModel, on_delete=models.CASCADE)
+    description = models.TextField(default="")
+
+
+class EagerLoadingGrandchildModel(models.Model):
+    child = models.ForeignKey(
+        EagerLoadingChildModel, related_name="grandchildren", on_delete=models.CASCADE
+    )
+    name = models.CharField()
+
+
+class EagerLoadingOwnerSerializer(ModelSerializer):
+    class Meta:
+        model = EagerLoadingOwnerModel
+        fields = ("id", "name")
+
+
+class EagerLoadingTagSerializer(ModelSerializer):
+    class Meta:
+        model = EagerLoadingTagModel
+        fields = ("id", "name")
+
+
+class EagerLoadingGrandchildSerializer(ModelSerializer):
+    class Meta:
+        model = EagerLoadingGrandchildModel
+        fields = ("id", "name")
+
+
+class EagerLoadingChildSerializer(NestedModelSerializer):
+    owner = EagerLoadingOwnerSerializer()
+    grandchildren = EagerLoadingGrandchildSerializer(many=True)
+
+    class Meta:
+        model = EagerLoadingChildModel
+        fields = ("id", "owner", "grandchildren")
+
+
+class EagerLoadingParentSerializer(NestedModelSerializer):
+    user = EagerLoadingOwnerSerializer(source="owner")
+    tags = EagerLoadingTagSerializer(many=True)
+    children = EagerLoadingChildSerializer(many=True)
+
+    class Meta:
+        model = EagerLoadingParentModel
+        fields = ("id", "user", "tags", "children")
+
+
+class EagerLoadingTest(TestCase):
+    def _create(self, count):
+        offset = EagerLoadingParentModel.objects.count()
+        for i in range(offset, offset + count):
+            owner = EagerLoadingOwnerModel.objects.create(name=f"Owner {i}")
+            parent = EagerLoadingParentModel.objects.create(owner=owner)
+            parent.tags.add(EagerLoadingTagModel.objects.create(name=f"Tag {i}"))
+            for j in range(3):
+                child = EagerLoadingChildModel.objects.create(
+                    parent=parent, owner=owner
+                )
+                EagerLoadingGrandchildModel.objects.create(child=child, name=f"{j}")
+
+    def _list(self):
+        queryset = EagerLoadingParentSerializer.setup_eager_loading(
+            EagerLoadingParentModel.objects.order_by("pk")
+        )
+        with CaptureQueriesContext(connection) as queries:
+            data = EagerLoadingParentSerializer(queryset, many=True).data
+        return data, len(queries)
+
+    def test_constant_queries(self):
+        self._create(2)
+        _, small = self._list()
+        self._create(8)
+        data, large = self._list()
+        assert small == large, f"{small} != {large}"
+
+        result = small
+        expected = 4
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        assert len(data) == 10
+        assert data[9]["user"]["name"] == "Owner 9"
+        assert data[9]["tags"][0]["name"] == "Tag 9"
+        assert [c["grandchildren"][0]["name"] for c in data[9]["children"]] == [
+            "0",
+            "1",
+            "2",
+        ]
+
+    def test_lookups(self):
+        queryset = EagerLoadingParentSerializer.setup_eager_loading(
+            EagerLoadingParentModel.objects.all()
+        )
+
+        result = set(queryset.query.select_related)
+        expected = {"owner"}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = [
+            lookup.prefetch_through for lookup in queryset._prefetch_related_lookups
+        ]
+        expected = ["tags", "children"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_only(self):
+        self._create(1)
+        queryset = EagerLoadingParentSerializer.setup_eager_loading(
+            EagerLoadingParentModel.objects.all()
+        )
+        parent = queryset.get()
+
+        result = parent.get_deferred_fields()
+        expected = set()
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = parent.owner.get_deferred_fields()
+        expected = {"description"}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        child = parent.children.all()[0]
+        result = child.get_deferred_fields()
+        expected = {"description"}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = child.owner.get_deferred_fields()
+        expected = {"description"}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
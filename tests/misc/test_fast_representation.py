@@ -0,0 +1,146 @@
+import datetime
+
+from django.db import models
+from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.serializers import ModelSerializer, Serializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class FastRepresentationOwnerModel(models.Model):
+    name = models.CharField()
+
+
+class FastRepresentationParentModel(models.Model):
+    name = models.CharField()
+    owner = models.ForeignKey(
+        FastRepresentationOwnerModel, null=True, on_delete=models.CASCADE
+    )
+
+
+class FastRepresentationNestedModel(models.Model):
+    parent = models.ForeignKey(
+        FastRepresentationParentModel,
+        related_name="nested",
+        on_delete=models.CASCADE,
+    )
+    owner = models.ForeignKey(
+        FastRepresentationOwnerModel, null=True, on_delete=models.CASCADE
+    )
+    name = models.CharField()
+    amount = models.DecimalField(max_digits=5, decimal_places=2)
+    date = models.DateField(null=True)
+
+
+class FastRepresentationSimpleNestedModel(models.Model):
+    parent = models.ForeignKey(
+        FastRepresentationOwnerModel,
+        related_name="children",
+        on_delete=models.CASCADE,
+    )
+    name = models.CharField()
+
+
+class FastRepresentationNestedSerializer(ModelSerializer):
+    owner_name = serializers.CharField(source="owner.name", default=None)
+    upper = serializers.SerializerMethodField()
+
+    class Meta:
+        model = FastRepresentationNestedModel
+        fields = ("id", "name", "amount", "date", "owner", "owner_name", "upper")
+
+    def get_upper(self, instance):
+        return instance.name.upper()
+
+
+class FastRepresentationCustomSerializer(ModelSerializer):
+    class Meta:
+        model = FastRepresentationOwnerModel
+        fields = ("id", "name")
+
+    def to_representation(self, instance):
+        return {"custom": instance.name}
+
+
+class FastRepresentationSimpleNestedSerializer(ModelSerializer):
+    class Meta:
+        model = FastRepresentationSimpleNestedModel
+        fields = ("id", "name")
+
+
+class FastRepresentationSimpleParentSerializer(NestedModelSerializer):
+    children = FastRepresentationSimpleNestedSerializer(many=True)
+
+    class Meta:
+        model = FastRepresentationOwnerModel
+        fields = ("id", "name", "children")
+
+
+class FastRepresentationParentSerializer(NestedModelSerializer):
+    nested = FastRepresentationNestedSerializer(many=True)
+    owner = FastRepresentationCustomSerializer(allow_null=True)
+
+    class Meta:
+        model = FastRepresentationParentModel
+        fields = ("id", "name", "owner", "nested")
+
+
+class FastRepresentationTest(TestCase):
+    def test_same_as_generic(self):
+        owner = FastRepresentationOwnerModel.objects.create(name="Owner")
+        parent = FastRepresentationParentModel.objects.create(
+            name="Parent", owner=owner
+        )
+        FastRepresentationNestedModel.objects.create(
+            parent=parent,
+            owner=owner,
+            name="Foo",
+            amount="1.50",
+            date=datetime.date(2024, 1, 2),
+        )
+        FastRepresentationNestedModel.objects.create(
+            parent=parent, name="Bar", amount="2"
+        )
+
+        serializer = FastRepresentationParentSerializer(instance=parent)
+        result = serializer.data
+        expected = Serializer.to_representation(serializer, parent)
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        expected = {
+            "id": parent.pk,
+            "name": "Parent",
+            "owner": {"custom": "Owner"},
+            "nested": [
+                {
+                    "id": 1,
+                    "name": "Foo",
+                    "amount": "1.50",
+                    "date": "2024-01-02",
+                    "owner": owner.pk,
+                    "owner_name": "Owner",
+                    "upper": "FOO",
+                },
+                {
+                    "id": 2,
+                    "name": "Bar",
+                    "amount": "2.00",
+                    "date": None,
+                    "owner": None,
+                    "owner_name": None,
+                    "upper": "BAR",
+                },
+            ],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_validated_data(self):
+        data = {"name": "a", "children": [{"name": "x"}]}
+
+        serializer = FastRepresentationSimpleParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+        result = serializer.data
+        expected = {"name": "a", "children": [{"id": None, "name": "x"}]}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,49 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class IdentityMapNestedModel(models.Model):
+    name = models.CharField()
+
+
+class IdentityMapParentModel(models.Model):
+    fk = models.ForeignKey(
+        IdentityMapNestedModel, on_delete=models.CASCADE, related_name="+"
+    )
+    m2m = models.ManyToManyField(IdentityMapNestedModel, related_name="+")
+
+
+class IdentityMapNestedSerializer(ModelSerializer):
+    class Meta:
+        model = IdentityMapNestedModel
+        fields = ("id", "name")
+
+
+class IdentityMapParentSerializer(NestedModelSerializer):
+    fk = IdentityMapNestedSerializer()
+    m2m = IdentityMapNestedSerializer(many=True)
+
+    class Meta:
+        model = IdentityMapParentModel
+        fields = ("id", "fk", "m2m")
+
+
+class IdentityMapTest(TestCase):
+    def test_same_instance(self):
+        IdentityMapNestedModel.objects.create(id=1, name="Max Mustermann")
+        data = {"fk": {"id": 1}, "m2m": [{"id": 1}, {"id": 1, "name": "John Doe"}]}
+
+        serializer = IdentityMapParentSerializer(data=data)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+        fk = serializer.validated_data["fk"]["id"]
+        m2m = [entry["id"] for entry in serializer.validated_data["m2m"]]
+        assert fk is m2m[0] is m2m[1]
+
+        instance = serializer.save()
+        assert instance.fk.name == "John Doe"
+        assert list(instance.m2m.all()) == [fk]
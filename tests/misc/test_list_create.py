@@ -0,0 +1,163 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ListSerializer, ModelSerializer
+
+from drf_nested_model_serializer.serializer import (
+    NestedListSerializer,
+    NestedModelSerializer,
+)
+
+
+class ListCreateOwnerModel(models.Model):
+    name = models.CharField()
+
+
+class ListCreateParentModel(models.Model):
+    name = models.CharField()
+    owner = models.ForeignKey(ListCreateOwnerModel, on_delete=models.CASCADE)
+
+
+class ListCreateChildModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        ListCreateParentModel, related_name="children", on_delete=models.CASCADE
+    )
+
+
+class ListCreateGrandchildModel(models.Model):
+    name = models.CharField()
+    child = models.ForeignKey(
+        ListCreateChildModel, related_name="grandchildren", on_delete=models.CASCADE
+    )
+
+
+class ListCreateOwnerSerializer(ModelSerializer):
+    class Meta:
+        model = ListCreateOwnerModel
+        fields = ("id", "name")
+
+
+class ListCreateGrandchildSerializer(ModelSerializer):
+    class Meta:
+        model = ListCreateGrandchildModel
+        fields = ("id", "name")
+
+
+class ListCreateChildSerializer(NestedModelSerializer):
+    grandchildren = ListCreateGrandchildSerializer(many=True)
+
+    class Meta:
+        model = ListCreateChildModel
+        fields = ("id", "name", "grandchildren")
+
+
+class ListCreateParentSerializer(NestedModelSerializer):
+    owner = ListCreateOwnerSerializer()
+    children = ListCreateChildSerializer(many=True)
+
+    class Meta:
+        model = ListCreateParentModel
+        fields = ("id", "name", "owner", "children")
+
+
+class ListCreateCustomParentSerializer(ListCreateParentSerializer):
+    def create(self, validated_data):
+        validated_data["name"] = validated_data["name"].upper()
+        return super().create(validated_data)
+
+
+class ListCreatePlainListParentSerializer(ListCreateParentSerializer):
+    class Meta(ListCreateParentSerializer.Meta):
+        list_serializer_class = ListSerializer
+
+
+class ListCreateTest(TestCase):
+    def _data(self, count):
+        return [
+            {
+                "name": f"Parent {i}",
+                "owner": {"name": f"Owner {i}"},
+                "children": [
+                    {
+                        "name": f"Child {i}.{j}",
+                        "grandchildren": [{"name": f"Grandchild {i}.{j}"}],
+                    }
+                    for j in range(2)
+                ],
+            }
+            for i in range(count)
+        ]
+
+    def _save(self, serializer_class, count):
+        serializer = serializer_class(data=self._data(count), many=True)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            instances = serializer.save()
+        return serializer, instances, len(queries)
+
+    def test_list_serializer_class(self):
+        serializer = ListCreateParentSerializer(many=True)
+        assert isinstance(serializer, NestedListSerializer), type(serializer)
+
+        serializer = ListCreatePlainListParentSerializer(many=True)
+        assert type(serializer) is ListSerializer, type(serializer)
+
+    def test_empty(self):
+        serializer = ListCreateParentSerializer(data=[], many=True)
+        assert serializer.is_valid(), serializer.errors
+
+        result = serializer.save()
+        expected = []
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_constant_queries(self):
+        _, _, small = self._save(ListCreateParentSerializer, 5)
+        serializer, instances, large = self._save(ListCreateParentSerializer, 100)
+        assert small == large, f"{small} != {large}"
+
+        result = ListCreateParentSerializer(instances, many=True).data
+        expected = serializer.data
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = [parent["name"] for parent in result]
+        expected = [f"Parent {i}" for i in range(100)]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = ListCreateGrandchildModel.objects.filter(
+            child__parent=instances[99]
+        ).count()
+        expected = 2
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_custom_create(self):
+        _, instances, _ = self._save(ListCreateCustomParentSerializer, 2)
+
+        result = [instance.name for instance in instances]
+        expected = ["PARENT 0", "PARENT 1"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_batch_lookup(self):
+        children = [
+            ListCreateChildModel.objects.create(
+                name="Child",
+                parent=ListCreateParentModel.objects.create(
+                    name="Parent",
+                    owner=ListCreateOwnerModel.objects.create(name="Owner"),
+                ),
+            )
+            for _ in range(3)
+        ]
+        data = [
+            {
+                "name": "Parent",
+                "owner": {"name": "Owner"},
+                "children": [{"id": child.pk, "name": "Moved"}],
+            }
+            for child in children
+        ]
+
+        serializer = ListCreateParentSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
@@ -0,0 +1,93 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class LookupFieldsParentModel(models.Model):
+    pass
+
+
+class LookupFieldsNestedModel(models.Model):
+    slug = models.SlugField(unique=True)
+    name = models.CharField()
+    parent = models.ForeignKey(
+        LookupFieldsParentModel, related_name="items", on_delete=models.CASCADE
+    )
+
+
+class LookupFieldsNestedSerializer(ModelSerializer):
+    class Meta:
+        model = LookupFieldsNestedModel
+        fields = ("id", "slug", "name")
+
+
+class LookupFieldsParentSerializer(NestedModelSerializer):
+    items = LookupFieldsNestedSerializer(many=True)
+
+    class Meta:
+        model = LookupFieldsParentModel
+        fields = ("id", "items")
+        nested_lookup_fields = {"items": "slug"}
+
+
+class LookupFieldsUnknownSerializer(NestedModelSerializer):
+    items = LookupFieldsNestedSerializer(many=True)
+
+    class Meta:
+        model = LookupFieldsParentModel
+        fields = ("id", "items")
+        nested_lookup_fields = {"items": "code"}
+
+
+class LookupFieldsTest(TestCase):
+    def test_lookup(self):
+        parent = LookupFieldsParentModel.objects.create()
+        first = LookupFieldsNestedModel.objects.create(
+            slug="first", name="First", parent=parent
+        )
+        second = LookupFieldsNestedModel.objects.create(
+            slug="second", name="Second", parent=parent
+        )
+        data = {
+            "items": [
+                {"slug": "second", "name": "Updated"},
+                {"slug": "first"},
+                {"slug": "third", "name": "Third"},
+            ]
+        }
+
+        serializer = LookupFieldsParentSerializer(data=data, instance=parent)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+        items = serializer.validated_data["items"]
+        assert items[0]["id"] is not second, items
+        assert items[0]["id"].pk == second.pk, items
+        assert items[1]["id"].pk == first.pk, items
+        assert "id" not in items[2], items
+
+        instance = serializer.save()
+        result = list(instance.items.order_by("pk").values_list("pk", "slug", "name"))
+        expected = [
+            (first.pk, "first", "First"),
+            (second.pk, "second", "Updated"),
+            (second.pk + 1, "third", "Third"),
+        ]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_new_entry_requires_fields(self):
+        data = {"items": [{"slug": "missing"}]}
+
+        serializer = LookupFieldsParentSerializer(data=data)
+        assert not serializer.is_valid()
+        assert "name" in serializer.errors["items"][0], serializer.errors
+
+    def test_unknown_field(self):
+        with self.assertRaises(AssertionError) as context:
+            LookupFieldsUnknownSerializer()
+
+        result = str(context.exception)
+        expected = "The 'nested_lookup_fields' option of 'items' names 'code', which is not a concrete field of 'LookupFieldsNestedModel'."
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
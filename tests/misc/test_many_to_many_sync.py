@@ -0,0 +1,140 @@
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class ManyToManySyncTagModel(models.Model):
+    name = models.CharField()
+
+
+class ManyToManySyncParentModel(models.Model):
+    name = models.CharField()
+    tags = models.ManyToManyField(ManyToManySyncTagModel, related_name="parents")
+
+
+class ManyToManySyncItemModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        ManyToManySyncParentModel, related_name="items", on_delete=models.CASCADE
+    )
+    tags = models.ManyToManyField(ManyToManySyncTagModel, related_name="items")
+
+
+class ManyToManySyncTagSerializer(ModelSerializer):
+    class Meta:
+        model = ManyToManySyncTagModel
+        fields = ("id", "name")
+
+
+class ManyToManySyncItemSerializer(ModelSerializer):
+    class Meta:
+        model = ManyToManySyncItemModel
+        fields = ("id", "name", "tags")
+
+
+class ManyToManySyncParentSerializer(NestedModelSerializer):
+    items = ManyToManySyncItemSerializer(many=True)
+
+    class Meta:
+        model = ManyToManySyncParentModel
+        fields = ("id", "name", "tags", "items")
+
+
+class ManyToManySyncNestedTagsSerializer(NestedModelSerializer):
+    tags = ManyToManySyncTagSerializer(many=True)
+
+    class Meta:
+        model = ManyToManySyncParentModel
+        fields = ("id", "name", "tags")
+
+
+class ManyToManySyncTagParentsSerializer(NestedModelSerializer):
+    parents = ManyToManySyncNestedTagsSerializer(many=True)
+
+    class Meta:
+        model = ManyToManySyncTagModel
+        fields = ("id", "name", "parents")
+
+
+class ManyToManySyncTest(TestCase):
+    def setUp(self):
+        self.tags = [
+            ManyToManySyncTagModel.objects.create(name=f"Tag {i}") for i in range(4)
+        ]
+
+    def _save(self, serializer_class, data, instance=None):
+        serializer = serializer_class(instance, data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            instance = serializer.save()
+        return instance, [query["sql"] for query in queries.captured_queries]
+
+    def _tag_ids(self, manager):
+        return sorted(manager.values_list("pk", flat=True))
+
+    def test_forward(self):
+        tag_0, tag_1, tag_2, tag_3 = [tag.pk for tag in self.tags]
+        data = {
+            "name": "Parent",
+            "tags": [tag_0, tag_1],
+            "items": [
+                {"name": f"Item {i}", "tags": [tag_0, tag_1, tag_2]} for i in range(3)
+            ],
+        }
+        instance, queries = self._save(ManyToManySyncParentSerializer, data)
+
+        result = sum(query.startswith("INSERT") for query in queries)
+        expected = 4
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        data = ManyToManySyncParentSerializer(instance).data
+        data["tags"] = [tag_1, tag_3]
+        for item in data["items"]:
+            item["tags"] = [tag_2, tag_3]
+        instance, queries = self._save(ManyToManySyncParentSerializer, data, instance)
+
+        result = [query.split()[0] for query in queries if "_tags" in query]
+        expected = ["SELECT", "INSERT", "DELETE", "SELECT", "INSERT", "DELETE"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert not any(
+            '"tests_manytomanysynctagmodel"."name"' in query for query in queries
+        ), queries
+
+        result = self._tag_ids(instance.tags)
+        expected = [tag_1, tag_3]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        result = [self._tag_ids(item.tags) for item in instance.items.all()]
+        expected = [[tag_2, tag_3]] * 3
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_nested_forward(self):
+        data = {"name": "Parent", "tags": [{"id": self.tags[0].pk}, {"name": "New"}]}
+        instance, _ = self._save(ManyToManySyncNestedTagsSerializer, data)
+
+        result = sorted(instance.tags.values_list("name", flat=True))
+        expected = ["New", "Tag 0"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        data = {"name": "Parent", "tags": [{"id": self.tags[1].pk}]}
+        instance, _ = self._save(ManyToManySyncNestedTagsSerializer, data, instance)
+
+        result = self._tag_ids(instance.tags)
+        expected = [self.tags[1].pk]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_reverse(self):
+        parent = ManyToManySyncParentModel.objects.create(name="Old")
+        parent.tags.add(self.tags[0])
+        data = {
+            "name": "Tag 0",
+            "parents": [{"name": "New 1", "tags": []}, {"name": "New 2", "tags": []}],
+        }
+        instance, _ = self._save(ManyToManySyncTagParentsSerializer, data, self.tags[0])
+
+        result = sorted(instance.parents.values_list("name", flat=True))
+        expected = ["New 1", "New 2"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert not parent.tags.exists()
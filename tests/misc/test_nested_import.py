@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class NestedImportParentModel(models.Model):
+    name = models.CharField(max_length=10)
+
+
+class NestedImportNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        NestedImportParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class NestedImportNestedSerializer(ModelSerializer):
+    class Meta:
+        model = NestedImportNestedModel
+        fields = ("id", "name")
+
+
+class NestedImportParentSerializer(NestedModelSerializer):
+    nested = NestedImportNestedSerializer(many=True)
+
+    class Meta:
+        model = NestedImportParentModel
+        fields = ("id", "name", "nested")
+
+
+SERIALIZER = "tests.misc.test_nested_import.NestedImportParentSerializer"
+
+
+class NestedImportTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "data.ndjson")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _import(self, lines, *args):
+        with open(self.path, "w") as file:
+            file.write("\n".join(lines))
+        stdout = StringIO()
+        call_command("nested_import", SERIALIZER, self.path, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_import(self):
+        lines = [
+            json.dumps({"name": f"Parent {i}", "nested": [{"name": f"Nested {i}"}]})
+            for i in range(5)
+        ]
+        output = self._import(lines, "--chunk-size", "2")
+
+        result = NestedImportNestedModel.objects.count()
+        expected = 5
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert output.count("Chunk ") == 3, output
+        assert "5 created" in output, output
+        assert not os.path.exists(f"{self.path}.rejects")
+
+    def test_rejects(self):
+        lines = [
+            json.dumps({"name": "Parent", "nested": []}),
+            "{invalid",
+            "",
+            json.dumps({"name": "Too long name", "nested": []}),
+        ]
+        output = self._import(lines)
+
+        result = NestedImportParentModel.objects.count()
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert "Rejected 2 rows" in output, output
+
+        with open(f"{self.path}.rejects") as file:
+            rejects = [json.loads(line) for line in file]
+        result = [reject["line"] for reject in rejects]
+        expected = [2, 4]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert list(rejects[1]["errors"]) == ["name"], rejects
+
+    def test_empty_file(self):
+        output = self._import([])
+        assert "Imported 0 rows" in output, output
+
+    def test_invalid_serializer(self):
+        with self.assertRaises(CommandError):
+            call_command("nested_import", "tests.settings.DEBUG", self.path)
@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class NestingPlanNestedModel(models.Model):
+    name = models.CharField()
+
+
+class NestingPlanParentModel(models.Model):
+    nested = models.ForeignKey(NestingPlanNestedModel, on_delete=models.CASCADE)
+
+
+class NestingPlanRelModel(models.Model):
+    parent = models.ForeignKey(
+        NestingPlanParentModel, on_delete=models.CASCADE, related_name="rel"
+    )
+
+
+class NestingPlanNestedSerializer(ModelSerializer):
+    class Meta:
+        model = NestingPlanNestedModel
+        fields = ("id", "name")
+
+
+class NestingPlanRelSerializer(ModelSerializer):
+    class Meta:
+        model = NestingPlanRelModel
+        fields = ("id", "parent")
+
+
+class NestingPlanParentSerializer(NestedModelSerializer):
+    nested = NestingPlanNestedSerializer()
+    rel = NestingPlanRelSerializer(many=True)
+
+    class Meta:
+        model = NestingPlanParentModel
+        fields = ("id", "nested", "rel")
+
+
+class NestingPlanSlimSerializer(NestingPlanParentSerializer):
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.context.get("slim"):
+            fields.pop("rel")
+        return fields
+
+
+class NestingPlanTest(TestCase):
+    def test_compiled_once(self):
+        if "_compiled_nesting_plans" in vars(NestingPlanParentSerializer):
+            del NestingPlanParentSerializer._compiled_nesting_plans
+
+        with mock.patch.object(
+            NestedModelSerializer,
+            "_compile_nesting_plan",
+            autospec=True,
+            side_effect=NestedModelSerializer._compile_nesting_plan,
+        ) as compile_nesting_plan:
+            first = NestingPlanParentSerializer()
+            second = NestingPlanParentSerializer()
+        assert compile_nesting_plan.call_count == 1
+
+        assert first._nesting_plan is second._nesting_plan
+        assert first.fields["nested"] is not second.fields["nested"]
+        assert "id" in second.fields["nested"].fields
+        assert second.fields["rel"].child.fields["parent"].read_only
+
+    def test_plan(self):
+        plan = NestingPlanParentSerializer()._nesting_plan
+
+        assert list(plan.keys()) == ["nested", "rel"]
+        assert plan["nested"].forward and not plan["nested"].reverse
+        assert not plan["nested"].many
+        assert plan["nested"].serializer_class is NestingPlanNestedSerializer
+        assert plan["rel"].reverse and plan["rel"].many
+        assert plan["rel"].related_name == "parent"
+        assert plan["rel"].pk_name == "id"
+        assert plan["rel"].null is False
+
+    def test_context_dependent_fields(self):
+        nested = NestingPlanNestedModel.objects.create(name="Nested")
+        slim = NestingPlanSlimSerializer(context={"slim": True})
+        assert list(slim._nesting_plan.keys()) == ["nested"]
+
+        serializer = NestingPlanSlimSerializer(
+            data={"nested": {"id": nested.pk, "name": "Nested"}, "rel": [{}]}
+        )
+        assert serializer.is_valid(), serializer.errors
+        instance = serializer.save()
+
+        result = list(instance.rel.values_list("parent", flat=True))
+        expected = [instance.pk]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,106 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class OrphanParentModel(models.Model):
+    pass
+
+
+class OrphanNullableModel(models.Model):
+    parent = models.ForeignKey(
+        OrphanParentModel,
+        related_name="nullable",
+        on_delete=models.CASCADE,
+        null=True,
+    )
+
+
+class OrphanNonNullableModel(models.Model):
+    parent = models.ForeignKey(
+        OrphanParentModel, related_name="non_nullable", on_delete=models.CASCADE
+    )
+
+
+class OrphanOneToOneModel(models.Model):
+    name = models.CharField()
+    parent = models.OneToOneField(
+        OrphanParentModel, related_name="one_to_one", on_delete=models.CASCADE
+    )
+
+
+class OrphanNullableSerializer(ModelSerializer):
+    class Meta:
+        model = OrphanNullableModel
+        fields = ("id",)
+
+
+class OrphanNonNullableSerializer(ModelSerializer):
+    class Meta:
+        model = OrphanNonNullableModel
+        fields = ("id",)
+
+
+class OrphanOneToOneSerializer(ModelSerializer):
+    class Meta:
+        model = OrphanOneToOneModel
+        fields = ("id", "name")
+
+
+class OrphanParentSerializer(NestedModelSerializer):
+    nullable = OrphanNullableSerializer(many=True, required=False)
+    non_nullable = OrphanNonNullableSerializer(many=True, required=False)
+    one_to_one = OrphanOneToOneSerializer(required=False)
+
+    class Meta:
+        model = OrphanParentModel
+        fields = ("id", "nullable", "non_nullable", "one_to_one")
+
+
+class OrphanTest(TestCase):
+    def _save(self, instance, data):
+        serializer = OrphanParentSerializer(instance=instance, data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        return len(queries)
+
+    def test_nullable(self):
+        small = OrphanParentModel.objects.create()
+        large = OrphanParentModel.objects.create()
+        for parent, count in ((small, 5), (large, 50)):
+            OrphanNullableModel.objects.bulk_create(
+                OrphanNullableModel(parent=parent) for _ in range(count)
+            )
+
+        small_queries = self._save(small, {"nullable": [{"id": 1}, {"id": 2}, {}]})
+        large_queries = self._save(large, {"nullable": [{"id": 6}, {"id": 7}, {}]})
+        assert small_queries == large_queries, f"{small_queries} != {large_queries}"
+
+        assert OrphanNullableModel.objects.count() == 57
+        result = set(small.nullable.values_list("id", flat=True))
+        assert result == {1, 2, 56}, result
+        result = set(large.nullable.values_list("id", flat=True))
+        assert result == {6, 7, 57}, result
+
+    def test_non_nullable(self):
+        parent = OrphanParentModel.objects.create()
+        OrphanNonNullableModel.objects.bulk_create(
+            OrphanNonNullableModel(parent=parent) for _ in range(5)
+        )
+
+        self._save(parent, {"non_nullable": [{"id": 2}, {"id": 4}]})
+        result = set(OrphanNonNullableModel.objects.values_list("id", flat=True))
+        assert result == {2, 4}, result
+
+    def test_one_to_one_same_pk(self):
+        parent = OrphanParentModel.objects.create()
+        OrphanOneToOneModel.objects.create(id=3, name="Max Mustermann", parent=parent)
+
+        self._save(parent, {"one_to_one": {"id": 3, "name": "Erika Musterfrau"}})
+        result = list(OrphanOneToOneModel.objects.values_list("id", "name"))
+        assert result == [(3, "Erika Musterfrau")], result
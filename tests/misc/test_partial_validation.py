@@ -0,0 +1,71 @@
+from django.test import TestCase
+from rest_framework.schemas.openapi import AutoSchema
+
+from tests.relationships.test_foreign_key import (
+    ForeignKeyNestedModel,
+    ForeignKeyParentSerializer,
+)
+from tests.relationships.test_many_to_one_rel import (
+    ManyToOneRelNestedModel,
+    ManyToOneRelNestedModelSerializer,
+    ManyToOneRelParentSerializer,
+)
+
+
+class PartialValidationTest(TestCase):
+    def test_partial_with_pk(self):
+        ManyToOneRelNestedModel.objects.create(id=3, name="Max Mustermann")
+
+        serializer = ManyToOneRelParentSerializer(data={"nested": [{"id": 3}]})
+        assert serializer.is_valid(), serializer.errors
+        result = serializer.validated_data
+        expected = {"nested": [{"id": ManyToOneRelNestedModel.objects.get(id=3)}]}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        child = serializer.fields["nested"].child
+        assert child.fields["name"].required
+        assert not serializer.partial
+
+        serializer = ManyToOneRelParentSerializer(data={"nested": [{"id": None}]})
+        assert not serializer.is_valid()
+        expected = {"nested": [{"name": ["This field is required."]}]}
+        assert serializer.errors == expected, serializer.errors
+
+    def test_partial_single_with_pk(self):
+        ForeignKeyNestedModel.objects.create(id=3, name="Max Mustermann")
+
+        serializer = ForeignKeyParentSerializer(data={"nested": {"id": 3}})
+        assert serializer.is_valid(), serializer.errors
+        result = serializer.validated_data
+        expected = {"nested": {"id": ForeignKeyNestedModel.objects.get(id=3)}}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        serializer = ForeignKeyParentSerializer(data={"nested": {}})
+        assert not serializer.is_valid()
+        expected = {"nested": {"name": ["This field is required."]}}
+        assert serializer.errors == expected, serializer.errors
+
+    def test_serializer_class(self):
+        child = ManyToOneRelParentSerializer().fields["nested"].child
+
+        assert type(child) is ManyToOneRelNestedModelSerializer
+        assert repr(child).startswith("ManyToOneRelNestedModelSerializer(")
+
+    def test_schema_component_name(self):
+        child = ManyToOneRelParentSerializer().fields["nested"].child
+
+        result = AutoSchema().get_component_name(child)
+        expected = AutoSchema().get_component_name(ManyToOneRelNestedModelSerializer())
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_partial_restored(self):
+        ManyToOneRelNestedModel.objects.create(id=3, name="Max Mustermann")
+        serializer = ManyToOneRelParentSerializer(
+            data={"nested": [{"id": 3}, {"id": None}]}
+        )
+
+        assert not serializer.is_valid()
+        result = serializer.errors
+        expected = {"nested": [{}, {"name": ["This field is required."]}]}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert not serializer.partial
@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.db import models
+from django.test import TestCase
+
+from tests.misc.test_nesting import NestingParentSerializer
+from tests.relationships.test_one_to_one_rel import OneToOneRelParentSerializer
+
+
+def _nesting_data():
+    return {
+        "many_to_many_rel": [
+            {
+                "many_to_one_rel": [
+                    {
+                        "one_to_one_rel": {
+                            "many_to_many": [
+                                {"foreign_key": {"one_to_one": {"name": "Max"}}},
+                                {"foreign_key": {"one_to_one": {"name": "Erika"}}},
+                            ],
+                        }
+                    },
+                ]
+            },
+        ]
+    }
+
+
+class RefreshTest(TestCase):
+    def _count_refreshes(self, **kwargs):
+        serializer = NestingParentSerializer(data=_nesting_data())
+        assert serializer.is_valid(), serializer.errors
+        with mock.patch.object(
+            models.Model, "refresh_from_db", autospec=True
+        ) as refresh_from_db:
+            instance = serializer.save(**kwargs)
+        return instance, refresh_from_db.call_args_list
+
+    def test_top_level_only(self):
+        instance, calls = self._count_refreshes()
+        assert calls == [mock.call(instance)], calls
+
+    def test_none(self):
+        instance, calls = self._count_refreshes(nested_refresh="none")
+        assert calls == [], calls
+
+    def test_full(self):
+        instance, calls = self._count_refreshes(nested_refresh="full")
+        assert len(calls) == 8, calls
+
+    def test_fields(self):
+        instance, calls = self._count_refreshes(nested_refresh=["id"])
+        assert calls == [mock.call(instance, fields=["id"])], calls
+
+    def test_data(self):
+        data = {"nested": {"name": "Max Mustermann"}}
+        expected = {"id": 1, "nested": {"id": 1, "name": "Max Mustermann"}}
+
+        serializer = OneToOneRelParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        instance = serializer.save(nested_refresh="none")
+        result = OneToOneRelParentSerializer(instance=instance).data
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,167 @@
+from django.core.cache import caches
+from django.db import models, transaction
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class RepresentationCacheParentModel(models.Model):
+    name = models.CharField()
+
+
+class RepresentationCacheNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        RepresentationCacheParentModel,
+        related_name="nested",
+        on_delete=models.CASCADE,
+    )
+
+
+class RepresentationCacheNestedSerializer(ModelSerializer):
+    class Meta:
+        model = RepresentationCacheNestedModel
+        fields = ("id", "name")
+
+
+class RepresentationCacheParentSerializer(NestedModelSerializer):
+    nested = RepresentationCacheNestedSerializer(many=True)
+
+    class Meta:
+        model = RepresentationCacheParentModel
+        fields = ("id", "name", "nested")
+        nested_cache = "default"
+
+
+class RepresentationCacheNestedWriteSerializer(NestedModelSerializer):
+    class Meta:
+        model = RepresentationCacheNestedModel
+        fields = ("id", "name")
+
+
+class RepresentationCacheCachedNestedSerializer(NestedModelSerializer):
+    class Meta:
+        model = RepresentationCacheNestedModel
+        fields = ("id", "name")
+        nested_cache = "default"
+
+
+class RepresentationCacheWriteOnlySerializer(NestedModelSerializer):
+    nested = RepresentationCacheNestedSerializer(many=True, write_only=True)
+
+    class Meta:
+        model = RepresentationCacheParentModel
+        fields = ("id", "name", "nested")
+
+
+class RepresentationCacheTest(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.parent = RepresentationCacheParentModel.objects.create(name="Parent")
+        self.nested = RepresentationCacheNestedModel.objects.create(
+            name="Nested", parent=self.parent
+        )
+
+    def _data(self):
+        instance = RepresentationCacheParentModel.objects.get(pk=self.parent.pk)
+        return RepresentationCacheParentSerializer(instance=instance).data
+
+    def test_cached(self):
+        self._data()
+
+        instance = RepresentationCacheParentModel.objects.get(pk=self.parent.pk)
+        with self.assertNumQueries(0):
+            result = RepresentationCacheParentSerializer(instance=instance).data
+        expected = {
+            "id": self.parent.pk,
+            "name": "Parent",
+            "nested": [{"id": self.nested.pk, "name": "Nested"}],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_invalidated_by_update(self):
+        self._data()
+
+        data = {"name": "Parent 2", "nested": [{"id": self.nested.pk, "name": "Foo"}]}
+        serializer = RepresentationCacheParentSerializer(
+            data=data, instance=self.parent
+        )
+        assert serializer.is_valid(), serializer.errors
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save()
+
+        result = self._data()
+        expected = {
+            "id": self.parent.pk,
+            "name": "Parent 2",
+            "nested": [{"id": self.nested.pk, "name": "Foo"}],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_invalidated_by_nested_write(self):
+        self._data()
+
+        data = {"name": "Foo"}
+        serializer = RepresentationCacheNestedWriteSerializer(
+            data=data, instance=self.nested
+        )
+        assert serializer.is_valid(), serializer.errors
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save()
+
+        result = self._data()["nested"]
+        expected = [{"id": self.nested.pk, "name": "Foo"}]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_not_invalidated_before_commit(self):
+        self._data()
+
+        data = {"name": "Foo"}
+        serializer = RepresentationCacheNestedWriteSerializer(
+            data=data, instance=self.nested
+        )
+        assert serializer.is_valid(), serializer.errors
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            serializer.save()
+
+        result = len(callbacks)
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_fresh_after_save_in_transaction(self):
+        self._data()
+
+        data = {"name": "Parent 2", "nested": [{"id": self.nested.pk, "name": "Foo"}]}
+        instance = RepresentationCacheParentModel.objects.get(pk=self.parent.pk)
+        with transaction.atomic():
+            serializer = RepresentationCacheParentSerializer(
+                data=data, instance=instance
+            )
+            assert serializer.is_valid(), serializer.errors
+            serializer.save()
+            result = serializer.data
+
+        expected = {
+            "id": self.parent.pk,
+            "name": "Parent 2",
+            "nested": [{"id": self.nested.pk, "name": "Foo"}],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_invalidated_by_write_only_nested(self):
+        serializer = RepresentationCacheCachedNestedSerializer(self.nested)
+        serializer.data
+
+        data = {"name": "Parent", "nested": [{"id": self.nested.pk, "name": "Foo"}]}
+        serializer = RepresentationCacheWriteOnlySerializer(
+            data=data, instance=self.parent
+        )
+        assert serializer.is_valid(), serializer.errors
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save()
+
+        instance = RepresentationCacheNestedModel.objects.get(pk=self.nested.pk)
+        result = RepresentationCacheCachedNestedSerializer(instance).data
+        expected = {"id": self.nested.pk, "name": "Foo"}
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,140 @@
+from django.db import connection, models
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class SingleSaveOwnerModel(models.Model):
+    name = models.CharField()
+
+
+class SingleSaveParentModel(models.Model):
+    name = models.CharField()
+    owner = models.ForeignKey(SingleSaveOwnerModel, on_delete=models.CASCADE)
+
+
+class SingleSaveChildModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        SingleSaveParentModel, related_name="children", on_delete=models.CASCADE
+    )
+    owner = models.ForeignKey(SingleSaveOwnerModel, on_delete=models.CASCADE)
+
+
+class SingleSaveGrandchildModel(models.Model):
+    name = models.CharField()
+    child = models.ForeignKey(
+        SingleSaveChildModel, related_name="grandchildren", on_delete=models.CASCADE
+    )
+
+
+class SingleSaveOwnerSerializer(ModelSerializer):
+    class Meta:
+        model = SingleSaveOwnerModel
+        fields = ("id", "name")
+
+
+class SingleSaveGrandchildSerializer(ModelSerializer):
+    class Meta:
+        model = SingleSaveGrandchildModel
+        fields = ("id", "name")
+
+
+class SingleSaveChildSerializer(NestedModelSerializer):
+    owner = SingleSaveOwnerSerializer()
+    grandchildren = SingleSaveGrandchildSerializer(many=True)
+
+    class Meta:
+        model = SingleSaveChildModel
+        fields = ("id", "name", "owner", "grandchildren")
+
+
+class SingleSaveParentSerializer(NestedModelSerializer):
+    owner = SingleSaveOwnerSerializer()
+    children = SingleSaveChildSerializer(many=True)
+
+    class Meta:
+        model = SingleSaveParentModel
+        fields = ("id", "name", "owner", "children")
+
+
+class SingleSaveTest(TestCase):
+    def _data(self, count):
+        return {
+            "name": "Parent",
+            "owner": {"name": "Owner"},
+            "children": [
+                {
+                    "name": f"Child {i}",
+                    "owner": {"name": f"Owner {i}"},
+                    "grandchildren": [
+                        {"name": f"Grandchild {i}.{j}"} for j in range(3)
+                    ],
+                }
+                for i in range(count)
+            ],
+        }
+
+    def _save(self, data, instance=None):
+        serializer = SingleSaveParentSerializer(data=data, instance=instance)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            instance = serializer.save()
+        return serializer, instance, len(queries)
+
+    def test_create_constant_queries(self):
+        _, _, small = self._save(self._data(2))
+        serializer, instance, large = self._save(self._data(20))
+        assert small == large, f"{small} != {large}"
+
+        result = SingleSaveParentSerializer(instance).data
+        expected = serializer.data
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        result = SingleSaveGrandchildModel.objects.filter(
+            child__parent=instance
+        ).count()
+        expected = 60
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_update_constant_queries(self):
+        counts = []
+        for count in (2, 20):
+            _, instance, _ = self._save(self._data(count))
+            data = SingleSaveParentSerializer(instance).data
+            for child in data["children"]:
+                child["name"] += " updated"
+                child["owner"]["name"] += " updated"
+                child["grandchildren"].append({"name": "New"})
+            _, instance, queries = self._save(data, instance)
+            counts.append(queries)
+
+        assert counts[0] == counts[1], counts
+        result = SingleSaveChildModel.objects.filter(
+            parent=instance, name__endswith=" updated", owner__name__endswith=" updated"
+        ).count()
+        expected = 20
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_top_level_signals(self):
+        saved = []
+
+        def receiver(sender, instance, created, **kwargs):
+            saved.append(created)
+
+        post_save.connect(receiver, sender=SingleSaveParentModel)
+        try:
+            _, instance, _ = self._save(self._data(1))
+            serializer = SingleSaveParentSerializer(
+                instance, data={"name": "Renamed"}, partial=True
+            )
+            assert serializer.is_valid(), serializer.errors
+            serializer.save()
+        finally:
+            post_save.disconnect(receiver, sender=SingleSaveParentModel)
+
+        result = saved
+        expected = [True, False]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
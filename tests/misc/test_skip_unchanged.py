@@ -0,0 +1,109 @@
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class SkipUnchangedParentModel(models.Model):
+    name = models.CharField()
+
+
+class SkipUnchangedSlugModel(models.Model):
+    name = models.CharField()
+    slug = models.CharField()
+
+    def save(self, *args, **kwargs):
+        self.slug = self.name.lower()
+        super().save(*args, **kwargs)
+
+
+class SkipUnchangedChildModel(models.Model):
+    name = models.CharField()
+    description = models.CharField()
+    parent = models.ForeignKey(
+        SkipUnchangedParentModel, related_name="children", on_delete=models.CASCADE
+    )
+
+
+class SkipUnchangedChildSerializer(ModelSerializer):
+    class Meta:
+        model = SkipUnchangedChildModel
+        fields = ("id", "name", "description")
+
+
+class SkipUnchangedParentSerializer(NestedModelSerializer):
+    children = SkipUnchangedChildSerializer(many=True)
+
+    class Meta:
+        model = SkipUnchangedParentModel
+        fields = ("id", "name", "children")
+        nested_bulk = False
+
+
+class SkipUnchangedSlugSerializer(NestedModelSerializer):
+    class Meta:
+        model = SkipUnchangedSlugModel
+        fields = ("id", "name")
+
+
+class SkipUnchangedTest(TestCase):
+    def _update(self, instance, data):
+        serializer = SkipUnchangedParentSerializer(instance, data=data)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+
+    def test_skip_unchanged(self):
+        parent = SkipUnchangedParentModel.objects.create(name="Parent")
+        for i in range(5):
+            SkipUnchangedChildModel.objects.create(
+                name=f"Child {i}", description=f"Description {i}", parent=parent
+            )
+        data = SkipUnchangedParentSerializer(parent).data
+        data["children"][2]["name"] = "Changed"
+
+        updates = [
+            query
+            for query in self._update(parent, data)
+            if "skipunchangedchildmodel" in query
+        ]
+
+        result = len(updates)
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert '"name"' in updates[0], updates[0]
+        assert '"description"' not in updates[0], updates[0]
+
+        result = list(
+            SkipUnchangedChildModel.objects.order_by("pk").values_list(
+                "name", flat=True
+            )
+        )
+        expected = ["Child 0", "Child 1", "Changed", "Child 3", "Child 4"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_top_level_saved(self):
+        parent = SkipUnchangedParentModel.objects.create(name="Parent")
+        data = SkipUnchangedParentSerializer(parent).data
+
+        result = len(self._update(parent, data))
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_top_level_derived_fields(self):
+        instance = SkipUnchangedSlugModel.objects.create(name="Foo")
+
+        serializer = SkipUnchangedSlugSerializer(instance, data={"name": "Bar"})
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        result = SkipUnchangedSlugModel.objects.values_list("name", "slug").get()
+        expected = ("Bar", "bar")
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
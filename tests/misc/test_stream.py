@@ -0,0 +1,73 @@
+import json
+
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class StreamParentModel(models.Model):
+    name = models.CharField()
+
+
+class StreamNestedModel(models.Model):
+    name = models.CharField()
+    parent = models.ForeignKey(
+        StreamParentModel, related_name="nested", on_delete=models.CASCADE
+    )
+
+
+class StreamNestedSerializer(ModelSerializer):
+    class Meta:
+        model = StreamNestedModel
+        fields = ("id", "name")
+
+
+class StreamParentSerializer(NestedModelSerializer):
+    nested = StreamNestedSerializer(many=True)
+
+    class Meta:
+        model = StreamParentModel
+        fields = ("id", "name", "nested")
+
+
+class StreamTest(TestCase):
+    def _create(self, count):
+        for i in range(count):
+            parent = StreamParentModel.objects.create(name=f"Parent {i}")
+            StreamNestedModel.objects.create(parent=parent, name=f"Nested {i}")
+
+    def test_stream(self):
+        self._create(25)
+        queryset = StreamParentModel.objects.all()
+
+        with self.assertNumQueries(6):
+            fragments = list(StreamParentSerializer.stream(queryset, chunk_size=10))
+
+        result = len(fragments)
+        expected = 5
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = json.loads(b"".join(fragments))
+        expected = json.loads(
+            json.dumps(StreamParentSerializer(queryset.order_by("pk"), many=True).data)
+        )
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_stream_empty(self):
+        queryset = StreamParentModel.objects.all()
+
+        result = b"".join(StreamParentSerializer.stream(queryset))
+        expected = b"[]"
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_stream_exact_chunks(self):
+        self._create(20)
+        queryset = StreamParentModel.objects.all()
+
+        with self.assertNumQueries(5):
+            result = json.loads(
+                b"".join(StreamParentSerializer.stream(queryset, chunk_size=10))
+            )
+        assert len(result) == 20
@@ -0,0 +1,96 @@
+from django.db import connection
+from django.db import models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class UpsertParentModel(models.Model):
+    pass
+
+
+class UpsertNestedModel(models.Model):
+    sku = models.CharField(unique=True)
+    name = models.CharField()
+    parent = models.ForeignKey(
+        UpsertParentModel, related_name="items", on_delete=models.CASCADE
+    )
+
+
+class UpsertNestedSerializer(ModelSerializer):
+    class Meta:
+        model = UpsertNestedModel
+        fields = ("id", "sku", "name")
+
+
+class UpsertParentSerializer(NestedModelSerializer):
+    items = UpsertNestedSerializer(many=True)
+
+    class Meta:
+        model = UpsertParentModel
+        fields = ("id", "items")
+        nested_upsert_keys = {"items": ["sku"]}
+
+
+class UpsertTest(TestCase):
+    def test_upsert(self):
+        parent = UpsertParentModel.objects.create()
+        existing = UpsertNestedModel.objects.create(sku="A", name="Old", parent=parent)
+        data = {
+            "items": [
+                {"sku": "A", "name": "Updated"},
+                {"sku": "B", "name": "New"},
+            ]
+        }
+
+        serializer = UpsertParentSerializer(data=data, instance=parent)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            instance = serializer.save()
+
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        result = len(inserts)
+        expected = 1
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+        result = UpsertParentSerializer(instance=instance).data
+        expected = {
+            "id": parent.pk,
+            "items": [
+                {"id": existing.pk, "sku": "A", "name": "Updated"},
+                {"id": instance.items.get(sku="B").pk, "sku": "B", "name": "New"},
+            ],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_upsert_moves_entry(self):
+        other = UpsertParentModel.objects.create()
+        existing = UpsertNestedModel.objects.create(sku="A", name="Old", parent=other)
+        data = {"items": [{"sku": "A", "name": "Moved"}]}
+
+        serializer = UpsertParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        instance = serializer.save()
+
+        existing.refresh_from_db()
+        result = (existing.parent_id, existing.name)
+        expected = (instance.pk, "Moved")
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_duplicate_keys(self):
+        data = {
+            "items": [
+                {"sku": "A", "name": "First"},
+                {"sku": "A", "name": "Second"},
+            ]
+        }
+
+        serializer = UpsertParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+
+        result = list(UpsertNestedModel.objects.values_list("sku", "name"))
+        expected = [("A", "Second")]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,153 @@
+import os
+
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class ValidationWorkersNestedModel(models.Model):
+    name = models.CharField()
+
+
+class ValidationWorkersUniqueModel(models.Model):
+    code = models.CharField(unique=True)
+
+
+class ValidationWorkersParentModel(models.Model):
+    name = models.CharField()
+    nested = models.ForeignKey(
+        ValidationWorkersNestedModel, null=True, on_delete=models.CASCADE
+    )
+
+
+class ValidationWorkersNestedSerializer(ModelSerializer):
+    class Meta:
+        model = ValidationWorkersNestedModel
+        fields = ("id", "name")
+
+
+class ValidationWorkersParentSerializer(NestedModelSerializer):
+    nested = ValidationWorkersNestedSerializer(required=False)
+
+    class Meta:
+        model = ValidationWorkersParentModel
+        fields = ("id", "name", "nested")
+        nested_validation_workers = 2
+
+    def validate(self, attrs):
+        attrs["pid"] = os.getpid()
+        return attrs
+
+
+class ValidationWorkersSaveSerializer(NestedModelSerializer):
+    nested = ValidationWorkersNestedSerializer(required=False)
+
+    class Meta:
+        model = ValidationWorkersParentModel
+        fields = ("id", "name", "nested")
+        nested_validation_workers = 2
+
+
+class ValidationWorkersUniqueSerializer(NestedModelSerializer):
+    class Meta:
+        model = ValidationWorkersUniqueModel
+        fields = ("id", "code")
+        nested_validation_workers = 2
+
+    def validate(self, attrs):
+        attrs["pid"] = os.getpid()
+        return attrs
+
+
+class ValidationWorkersTest(TestCase):
+    def test_parallel(self):
+        nested = ValidationWorkersNestedModel.objects.create(name="Foo")
+        data = [
+            {"name": "A", "nested": {"id": nested.pk}},
+            {"name": "B", "nested": {"id": nested.pk, "name": "Bar"}},
+            {"name": "C", "nested": {"name": "Baz"}},
+            {"name": "D"},
+        ]
+
+        serializer = ValidationWorkersParentSerializer(data=data, many=True)
+        with self.assertNumQueries(1):
+            assert serializer.is_valid(), serializer.errors
+
+        validated_data = serializer.validated_data
+        assert all(entry.pop("pid") != os.getpid() for entry in validated_data)
+        assert validated_data[0]["nested"]["id"] is validated_data[1]["nested"]["id"]
+        result = validated_data
+        expected = [
+            {"name": "A", "nested": {"id": nested}},
+            {"name": "B", "nested": {"id": nested, "name": "Bar"}},
+            {"name": "C", "nested": {"name": "Baz"}},
+            {"name": "D"},
+        ]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_errors(self):
+        data = [{"name": "A"}, {"nested": {"id": 404}}, {"name": "C"}, {}]
+
+        serializer = ValidationWorkersParentSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+
+        result = serializer.errors
+        expected = [
+            {},
+            {
+                "name": ["This field is required."],
+                "nested": {"id": ['Invalid pk "404" - object does not exist.']},
+            },
+            {},
+            {"name": ["This field is required."]},
+        ]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_database_fallback(self):
+        ValidationWorkersUniqueModel.objects.create(code="A")
+        data = [{"code": "A"}, {"code": "B"}]
+
+        serializer = ValidationWorkersUniqueSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+
+        result = serializer.errors
+        expected = [
+            {
+                "code": [
+                    "validation workers unique model with this code already exists."
+                ]
+            },
+            {},
+        ]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        assert serializer._validated_data == []
+
+    def test_bulk_save(self):
+        data = [{"name": str(index)} for index in range(5)] + [{}]
+
+        summary = ValidationWorkersSaveSerializer.bulk_save(data, on_error="skip")
+
+        result = (
+            summary.created,
+            summary.failed,
+            [index for index, _ in summary.errors],
+        )
+        expected = (5, 1, [5])
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+        result = sorted(
+            ValidationWorkersParentModel.objects.values_list("name", flat=True)
+        )
+        expected = ["0", "1", "2", "3", "4"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_partial(self):
+        data = [{"nested": {"name": f"Nested {i}"}} for i in range(4)]
+
+        serializer = ValidationWorkersSaveSerializer(data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+
+        result = serializer.validated_data
+        expected = [{"nested": {"name": f"Nested {i}"}} for i in range(4)]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
@@ -0,0 +1,99 @@
+from django.db import models
+from django.test import TestCase
+from rest_framework.serializers import ModelSerializer
+
+from drf_nested_model_serializer.serializer import NestedModelSerializer
+
+
+class WrittenCachesOwnerModel(models.Model):
+    name = models.CharField()
+
+
+class WrittenCachesTagModel(models.Model):
+    name = models.CharField()
+
+
+class WrittenCachesParentModel(models.Model):
+    owner = models.ForeignKey(WrittenCachesOwnerModel, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(WrittenCachesTagModel)
+
+
+class WrittenCachesChildModel(models.Model):
+    parent = models.ForeignKey(
+        WrittenCachesParentModel, related_name="children", on_delete=models.CASCADE
+    )
+    name = models.CharField()
+    tags = models.ManyToManyField(WrittenCachesTagModel)
+
+
+class WrittenCachesOwnerSerializer(ModelSerializer):
+    class Meta:
+        model = WrittenCachesOwnerModel
+        fields = ("id", "name")
+
+
+class WrittenCachesTagSerializer(ModelSerializer):
+    class Meta:
+        model = WrittenCachesTagModel
+        fields = ("id", "name")
+
+
+class WrittenCachesChildSerializer(NestedModelSerializer):
+    tags = WrittenCachesTagSerializer(many=True)
+
+    class Meta:
+        model = WrittenCachesChildModel
+        fields = ("id", "name", "tags")
+
+
+class WrittenCachesParentSerializer(NestedModelSerializer):
+    owner = WrittenCachesOwnerSerializer()
+    tags = WrittenCachesTagSerializer(many=True)
+    children = WrittenCachesChildSerializer(many=True)
+
+    class Meta:
+        model = WrittenCachesParentModel
+        fields = ("id", "owner", "tags", "children")
+
+
+class WrittenCachesTest(TestCase):
+    def test_data_without_queries(self):
+        tag = WrittenCachesTagModel.objects.create(name="Foo")
+        data = {
+            "owner": {"name": "Max Mustermann"},
+            "tags": [{"name": "Bar"}, {"id": tag.pk}],
+            "children": [
+                {"name": "Child 2", "tags": [{"id": tag.pk}]},
+                {"name": "Child 1", "tags": []},
+            ],
+        }
+
+        serializer = WrittenCachesParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        instance = serializer.save()
+        with self.assertNumQueries(0):
+            result = serializer.data
+
+        expected = {
+            "id": instance.pk,
+            "owner": {"id": instance.owner_id, "name": "Max Mustermann"},
+            "tags": [{"id": tag.pk + 1, "name": "Bar"}, {"id": tag.pk, "name": "Foo"}],
+            "children": [
+                {"id": 1, "name": "Child 2", "tags": [{"id": tag.pk, "name": "Foo"}]},
+                {"id": 2, "name": "Child 1", "tags": []},
+            ],
+        }
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
+
+    def test_caches_removed(self):
+        data = {"owner": {"name": "Max Mustermann"}, "tags": [], "children": []}
+
+        serializer = WrittenCachesParentSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+        instance = serializer.save()
+        serializer.data
+
+        WrittenCachesChildModel.objects.create(parent=instance, name="Child")
+        result = [child.name for child in instance.children.all()]
+        expected = ["Child"]
+        assert result == expected, f"\nResult:   {result}\nExpected: {expected}"
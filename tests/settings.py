@@ -1,6 +1,7 @@
 DEBUG = True
 INSTALLED_APPS = [
     "django.contrib.contenttypes",
+    "drf_nested_model_serializer",
     "tests",
 ]
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"